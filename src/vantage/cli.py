@@ -391,9 +391,10 @@ WantedBy=default.target
 @click.option(
     "--output",
     "-o",
-    type=click.Path(file_okay=False, dir_okay=True),
-    default="./vantage-static",
-    help="Output directory for the static site",
+    type=click.Path(),
+    default=None,
+    help="Output directory for the static site, or the archive file with --tar "
+    "(default: ./vantage-static, or ./vantage-static.tar with --tar)",
 )
 @click.option(
     "--frontend-dist",
@@ -413,12 +414,19 @@ WantedBy=default.target
     default="/",
     help="URL base path for deployment (e.g., /docs/). Currently unused — assets use relative paths.",
 )
+@click.option(
+    "--tar",
+    is_flag=True,
+    default=False,
+    help="Write the site as a single .tar archive at --output instead of a directory",
+)
 def build(
     repo_path: str,
-    output: str,
+    output: str | None,
     frontend_dist: str | None,
     name: str | None,
     base_path: str,  # noqa: ARG001
+    tar: bool,
 ):
     """Build a static site from a markdown repository.
 
@@ -439,10 +447,26 @@ def build(
     from vantage.services.static_builder import build_static_site
 
     source = Path(repo_path).resolve()
+    if output is None:
+        output = "./vantage-static.tar" if tar else "./vantage-static"
     output_path = Path(output).resolve()
+    if tar and output_path.is_dir():
+        raise click.BadParameter(
+            f"'{output}' is a directory; --tar writes an archive file.",
+            param_hint="'--output' / '-o'",
+        )
+    if not tar and output_path.is_file():
+        raise click.BadParameter(f"Directory '{output}' is a file.", param_hint="'--output' / '-o'")
     frontend_path = Path(frontend_dist).resolve() if frontend_dist else None
 
-    build_static_site(source, output_path, frontend_path, repo_name=name)
+    build_static_site(source, output_path, frontend_path, repo_name=name, tar=tar)
+
+    if tar:
+        click.echo("\nStatic site archive built successfully!")
+        click.echo(f"Output: {output_path}")
+        click.echo("\nTo unpack:")
+        click.echo(f"  mkdir -p site && tar -xf {output_path} -C site")
+        return
 
     click.echo("\nStatic site built successfully!")
     click.echo(f"Output: {output_path}")
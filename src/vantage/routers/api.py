@@ -2,10 +2,11 @@ import asyncio
 import logging
 import time
 from functools import partial
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 
-from vantage.config import RepoConfig
+from vantage.config import DaemonConfig, RepoConfig
 from vantage.schemas.models import (
     FileContent,
     FileDiff,
@@ -28,6 +29,10 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# The daemon config, resolved per request so tests can swap it through
+# app.dependency_overrides[get_daemon_config] instead of patching globals.
+DaemonConfigDep = Annotated[DaemonConfig | None, Depends(get_daemon_config)]
+
 # Cache for repo last_activity to make /api/repos instant.
 # Warmed on startup; refreshed in background periodically and on watcher events.
 _repo_activity_cache: dict[str, RepoInfo] = {}
@@ -36,7 +41,11 @@ _REPO_ACTIVITY_TTL = 30.0  # seconds before background refresh
 
 
 def get_fs_service(
-    repo: str | None = None, *, show_hidden: bool | None = None, show_gitignored: bool | None = None
+    daemon_config: DaemonConfig | None,
+    repo: str | None = None,
+    *,
+    show_hidden: bool | None = None,
+    show_gitignored: bool | None = None,
 ):
     """Get FileSystemService for the specified repo or default.
 
@@ -45,7 +54,6 @@ def get_fs_service(
     """
     hidden = show_hidden if show_hidden is not None else settings.show_hidden
     gitignored = show_gitignored if show_gitignored is not None else True
-    daemon_config = get_daemon_config()
     if daemon_config:
         if not repo:
             raise HTTPException(
@@ -70,12 +78,11 @@ def get_fs_service(
     )
 
 
-def get_git_service(repo: str | None = None):
+def get_git_service(daemon_config: DaemonConfig | None, repo: str | None = None):
     """Get GitService for the specified repo or default.
 
     In daemon mode, a repo name is required.
     """
-    daemon_config = get_daemon_config()
     if daemon_config:
         if not repo:
             raise HTTPException(
@@ -89,11 +96,10 @@ def get_git_service(repo: str | None = None):
     return GitService(settings.target_repo, exclude_dirs=settings.exclude_dirs)
 
 
-def get_jj_service(repo: str | None = None) -> JJService:
+def get_jj_service(daemon_config: DaemonConfig | None, repo: str | None = None) -> JJService:
     """Get JJService for the specified repo or default."""
     from pathlib import Path
 
-    daemon_config = get_daemon_config()
     if daemon_config:
         if not repo:
             raise HTTPException(
@@ -113,20 +119,20 @@ async def health():
 
 
 @router.get("/version", response_model=VersionInfo)
-async def get_version():
+async def get_version(daemon_config: DaemonConfigDep):
     """Get version information for the Vantage instance.
 
     Returns the current HEAD commit hash and whether the working directory
     has uncommitted changes.
     """
-    git = get_git_service()
+    git = get_git_service(daemon_config)
     commit_hash = git.get_head_commit_hash() or "unknown"
     is_dirty = git.is_working_dir_dirty()
     return VersionInfo(commit_hash=commit_hash, is_dirty=is_dirty)
 
 
 @router.get("/repos", response_model=list[RepoInfo])
-async def list_repos():
+async def list_repos(daemon_config: DaemonConfigDep):
     """List all configured repositories (multi-repo mode only).
 
     Returns instantly from cache.  Cache is warmed on startup and
@@ -134,7 +140,6 @@ async def list_repos():
     """
     global _repo_activity_cache, _repo_activity_cache_time
 
-    daemon_config = get_daemon_config()
     if not daemon_config:
         # Single repo mode - return single repo info
         return [RepoInfo(name="")]
@@ -146,7 +151,8 @@ async def list_repos():
 
     # First call before cache is ready (shouldn't happen if warmup ran,
     # but handle gracefully): return names instantly, timestamps arrive later.
-    return [RepoInfo(name=r.name) for r in daemon_config.repos]
+    # Names come from the already-validated RepoConfig, so skip re-validation.
+    return [RepoInfo.model_construct(name=r.name) for r in daemon_config.repos]
 
 
 async def _compute_repo_activity() -> dict[str, RepoInfo]:
@@ -234,12 +240,11 @@ async def refresh_repo_cache_loop() -> None:
 
 
 @router.get("/files/all")
-async def list_all_files_global():
+async def list_all_files_global(daemon_config: DaemonConfigDep):
     """List all files across all repositories."""
-    daemon_config = get_daemon_config()
     if not daemon_config:
         # Single-repo mode: return files with empty repo name
-        fs = get_fs_service()
+        fs = get_fs_service(daemon_config)
         return [{"repo": "", "path": p} for p in fs.list_all_files()]
 
     loop = asyncio.get_running_loop()
@@ -260,15 +265,17 @@ async def list_all_files_global():
 
 @router.get("/recent/all")
 async def get_recent_files_global(
-    limit: int = 10, show_hidden: bool = True, show_gitignored: bool = True
+    daemon_config: DaemonConfigDep,
+    limit: int = 10,
+    show_hidden: bool = True,
+    show_gitignored: bool = True,
 ):
     """Get recently changed files across all repositories."""
-    daemon_config = get_daemon_config()
     limit = min(max(limit, 1), 1000)
 
     if not daemon_config:
         # Single-repo mode
-        git = get_git_service()
+        git = get_git_service(daemon_config)
         loop = asyncio.get_running_loop()
         files = await loop.run_in_executor(
             None,
@@ -306,13 +313,16 @@ async def get_recent_files_global(
 # Multi-repo endpoints (when running in daemon mode)
 @router.get("/r/{repo}/tree", response_model=list[FileNode])
 async def get_tree_multi(
+    daemon_config: DaemonConfigDep,
     repo: str,
     path: str = ".",
     include_git: bool = False,
     show_hidden: bool = True,
     show_gitignored: bool = True,
 ):
-    fs = get_fs_service(repo, show_hidden=show_hidden, show_gitignored=show_gitignored)
+    fs = get_fs_service(
+        daemon_config, repo, show_hidden=show_hidden, show_gitignored=show_gitignored
+    )
     loop = asyncio.get_running_loop()
     try:
         return await loop.run_in_executor(
@@ -323,8 +333,8 @@ async def get_tree_multi(
 
 
 @router.get("/r/{repo}/content", response_model=FileContent)
-async def get_content_multi(repo: str, path: str):
-    fs = get_fs_service(repo)
+async def get_content_multi(daemon_config: DaemonConfigDep, repo: str, path: str):
+    fs = get_fs_service(daemon_config, repo)
     try:
         return fs.read_file(path)
     except ValueError as e:
@@ -332,14 +342,14 @@ async def get_content_multi(repo: str, path: str):
 
 
 @router.get("/r/{repo}/git/history", response_model=list[GitCommit])
-async def get_history_multi(repo: str, path: str):
-    git = get_git_service(repo)
+async def get_history_multi(daemon_config: DaemonConfigDep, repo: str, path: str):
+    git = get_git_service(daemon_config, repo)
     return git.get_history(path)
 
 
 @router.get("/r/{repo}/git/status", response_model=FileStatus)
-async def get_status_multi(repo: str, path: str):
-    git = get_git_service(repo)
+async def get_status_multi(daemon_config: DaemonConfigDep, repo: str, path: str):
+    git = get_git_service(daemon_config, repo)
     loop = asyncio.get_running_loop()
 
     def _get_status() -> FileStatus:
@@ -350,18 +360,23 @@ async def get_status_multi(repo: str, path: str):
     return await loop.run_in_executor(None, _get_status)
 
 
+_HEX_DIGITS = b"0123456789abcdefABCDEF"
+
+
 def _validate_commit_sha(sha: str) -> None:
     """Validate that a commit SHA looks like a hex string."""
-    import re
-
-    if not re.fullmatch(r"[0-9a-fA-F]{4,40}", sha):
+    # Deleting every hex digit in one C-level translate leaves nothing
+    # behind iff the (ASCII-only) string was all hex.
+    if not (
+        4 <= len(sha) <= 40 and sha.isascii() and not sha.encode().translate(None, _HEX_DIGITS)
+    ):
         raise HTTPException(status_code=400, detail="Invalid commit SHA")
 
 
 @router.get("/r/{repo}/git/diff", response_model=FileDiff)
-async def get_diff_multi(repo: str, path: str, commit: str):
+async def get_diff_multi(daemon_config: DaemonConfigDep, repo: str, path: str, commit: str):
     _validate_commit_sha(commit)
-    git = get_git_service(repo)
+    git = get_git_service(daemon_config, repo)
     diff = git.get_file_diff(path, commit)
     if not diff:
         raise HTTPException(status_code=404, detail="Could not generate diff")
@@ -369,8 +384,8 @@ async def get_diff_multi(repo: str, path: str, commit: str):
 
 
 @router.get("/r/{repo}/git/diff/working", response_model=FileDiff)
-async def get_working_diff_multi(repo: str, path: str):
-    git = get_git_service(repo)
+async def get_working_diff_multi(daemon_config: DaemonConfigDep, repo: str, path: str):
+    git = get_git_service(daemon_config, repo)
     diff = git.get_working_dir_diff(path)
     if not diff:
         raise HTTPException(status_code=404, detail="No uncommitted changes for this file")
@@ -379,12 +394,13 @@ async def get_working_diff_multi(repo: str, path: str):
 
 @router.get("/r/{repo}/git/recent")
 async def get_recent_files_multi(
+    daemon_config: DaemonConfigDep,
     repo: str,
     limit: int = 10,
     show_hidden: bool = True,
     show_gitignored: bool = True,
 ):
-    git = get_git_service(repo)
+    git = get_git_service(daemon_config, repo)
     limit = min(max(limit, 1), 1000)
     loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
@@ -399,37 +415,37 @@ async def get_recent_files_multi(
 
 
 @router.get("/r/{repo}/info")
-async def get_repo_info_multi(repo: str):
-    git = get_git_service(repo)
+async def get_repo_info_multi(daemon_config: DaemonConfigDep, repo: str):
+    git = get_git_service(daemon_config, repo)
     return {"name": git.get_repo_name(), "root_path": str(git.repo_path)}
 
 
 @router.get("/r/{repo}/files", response_model=list[str])
-async def list_all_files_multi(repo: str):
-    fs = get_fs_service(repo)
+async def list_all_files_multi(daemon_config: DaemonConfigDep, repo: str):
+    fs = get_fs_service(daemon_config, repo)
     return fs.list_all_files()
 
 
 @router.get("/r/{repo}/version", response_model=VersionInfo)
-async def get_version_multi(repo: str):
+async def get_version_multi(daemon_config: DaemonConfigDep, repo: str):
     """Get version information for a specific repository.
 
     Returns the current HEAD commit hash and whether the working directory
     has uncommitted changes.
     """
-    git = get_git_service(repo)
+    git = get_git_service(daemon_config, repo)
     commit_hash = git.get_head_commit_hash() or "unknown"
     is_dirty = git.is_working_dir_dirty()
     return VersionInfo(commit_hash=commit_hash, is_dirty=is_dirty)
 
 
-def _require_single_repo_mode() -> None:
+def _require_single_repo_mode(daemon_config: DaemonConfig | None) -> None:
     """Raise 404 if running in daemon/multi-repo mode.
 
     Legacy endpoints must not serve files from the default target_repo
     (which is CWD) when the server is in multi-repo mode.
     """
-    if settings.multi_repo:
+    if daemon_config is not None or settings.multi_repo:
         raise HTTPException(
             status_code=404,
             detail="Legacy endpoints are disabled in multi-repo mode. Use /api/r/{repo}/... instead.",
@@ -439,13 +455,14 @@ def _require_single_repo_mode() -> None:
 # Legacy single-repo endpoints (backward compatibility)
 @router.get("/tree", response_model=list[FileNode])
 async def get_tree(
+    daemon_config: DaemonConfigDep,
     path: str = ".",
     include_git: bool = False,
     show_hidden: bool = True,
     show_gitignored: bool = True,
 ):
-    _require_single_repo_mode()
-    fs = get_fs_service(show_hidden=show_hidden, show_gitignored=show_gitignored)
+    _require_single_repo_mode(daemon_config)
+    fs = get_fs_service(daemon_config, show_hidden=show_hidden, show_gitignored=show_gitignored)
     loop = asyncio.get_running_loop()
     try:
         return await loop.run_in_executor(
@@ -456,9 +473,9 @@ async def get_tree(
 
 
 @router.get("/content", response_model=FileContent)
-async def get_content(path: str):
-    _require_single_repo_mode()
-    fs = get_fs_service()
+async def get_content(daemon_config: DaemonConfigDep, path: str):
+    _require_single_repo_mode(daemon_config)
+    fs = get_fs_service(daemon_config)
     try:
         return fs.read_file(path)
     except ValueError as e:
@@ -466,16 +483,16 @@ async def get_content(path: str):
 
 
 @router.get("/git/history", response_model=list[GitCommit])
-async def get_history(path: str):
-    _require_single_repo_mode()
-    git = get_git_service()
+async def get_history(daemon_config: DaemonConfigDep, path: str):
+    _require_single_repo_mode(daemon_config)
+    git = get_git_service(daemon_config)
     return git.get_history(path)
 
 
 @router.get("/git/status", response_model=FileStatus)
-async def get_status(path: str):
-    _require_single_repo_mode()
-    git = get_git_service()
+async def get_status(daemon_config: DaemonConfigDep, path: str):
+    _require_single_repo_mode(daemon_config)
+    git = get_git_service(daemon_config)
     loop = asyncio.get_running_loop()
 
     def _get_status() -> FileStatus:
@@ -487,10 +504,10 @@ async def get_status(path: str):
 
 
 @router.get("/git/diff", response_model=FileDiff)
-async def get_diff(path: str, commit: str):
-    _require_single_repo_mode()
+async def get_diff(daemon_config: DaemonConfigDep, path: str, commit: str):
+    _require_single_repo_mode(daemon_config)
     _validate_commit_sha(commit)
-    git = get_git_service()
+    git = get_git_service(daemon_config)
     diff = git.get_file_diff(path, commit)
     if not diff:
         raise HTTPException(status_code=404, detail="Could not generate diff")
@@ -498,9 +515,9 @@ async def get_diff(path: str, commit: str):
 
 
 @router.get("/git/diff/working", response_model=FileDiff)
-async def get_working_diff(path: str):
-    _require_single_repo_mode()
-    git = get_git_service()
+async def get_working_diff(daemon_config: DaemonConfigDep, path: str):
+    _require_single_repo_mode(daemon_config)
+    git = get_git_service(daemon_config)
     diff = git.get_working_dir_diff(path)
     if not diff:
         raise HTTPException(status_code=404, detail="No uncommitted changes for this file")
@@ -508,10 +525,15 @@ async def get_working_diff(path: str):
 
 
 @router.get("/git/recent")
-async def get_recent_files(limit: int = 10, show_hidden: bool = True, show_gitignored: bool = True):
-    _require_single_repo_mode()
+async def get_recent_files(
+    daemon_config: DaemonConfigDep,
+    limit: int = 10,
+    show_hidden: bool = True,
+    show_gitignored: bool = True,
+):
+    _require_single_repo_mode(daemon_config)
     limit = min(max(limit, 1), 1000)
-    git = get_git_service()
+    git = get_git_service(daemon_config)
     loop = asyncio.get_running_loop()
     return await loop.run_in_executor(
         None,
@@ -525,16 +547,16 @@ async def get_recent_files(limit: int = 10, show_hidden: bool = True, show_gitig
 
 
 @router.get("/info")
-async def get_repo_info():
-    _require_single_repo_mode()
-    git = get_git_service()
+async def get_repo_info(daemon_config: DaemonConfigDep):
+    _require_single_repo_mode(daemon_config)
+    git = get_git_service(daemon_config)
     return {"name": git.get_repo_name(), "root_path": str(git.repo_path)}
 
 
 @router.get("/files", response_model=list[str])
-async def list_all_files():
-    _require_single_repo_mode()
-    fs = get_fs_service()
+async def list_all_files(daemon_config: DaemonConfigDep):
+    _require_single_repo_mode(daemon_config)
+    fs = get_fs_service(daemon_config)
     return fs.list_all_files()
 
 
@@ -542,26 +564,32 @@ async def list_all_files():
 
 
 @router.get("/r/{repo}/jj/info", response_model=JJInfo)
-async def get_jj_info_multi(repo: str):
-    jj = get_jj_service(repo)
+async def get_jj_info_multi(daemon_config: DaemonConfigDep, repo: str):
+    jj = get_jj_service(daemon_config, repo)
     return jj.get_info()
 
 
 @router.get("/r/{repo}/jj/log", response_model=list[JJRevision])
-async def get_jj_log_multi(repo: str, path: str | None = None, limit: int = 50):
-    jj = get_jj_service(repo)
+async def get_jj_log_multi(
+    daemon_config: DaemonConfigDep, repo: str, path: str | None = None, limit: int = 50
+):
+    jj = get_jj_service(daemon_config, repo)
     return jj.get_log(path=path, limit=min(max(limit, 1), 200))
 
 
 @router.get("/r/{repo}/jj/evolog", response_model=list[JJEvoEntry])
-async def get_jj_evolog_multi(repo: str, rev: str = "@", limit: int = 20):
-    jj = get_jj_service(repo)
+async def get_jj_evolog_multi(
+    daemon_config: DaemonConfigDep, repo: str, rev: str = "@", limit: int = 20
+):
+    jj = get_jj_service(daemon_config, repo)
     return jj.get_evolog(rev=rev, limit=min(max(limit, 1), 100))
 
 
 @router.get("/r/{repo}/jj/diff", response_model=FileDiff)
-async def get_jj_diff_multi(repo: str, rev: str, path: str | None = None):
-    jj = get_jj_service(repo)
+async def get_jj_diff_multi(
+    daemon_config: DaemonConfigDep, repo: str, rev: str, path: str | None = None
+):
+    jj = get_jj_service(daemon_config, repo)
     diff = jj.get_diff(rev=rev, path=path)
     if not diff:
         raise HTTPException(status_code=404, detail="Could not generate jj diff")
@@ -569,30 +597,30 @@ async def get_jj_diff_multi(repo: str, rev: str, path: str | None = None):
 
 
 @router.get("/jj/info", response_model=JJInfo)
-async def get_jj_info():
-    _require_single_repo_mode()
-    jj = get_jj_service()
+async def get_jj_info(daemon_config: DaemonConfigDep):
+    _require_single_repo_mode(daemon_config)
+    jj = get_jj_service(daemon_config)
     return jj.get_info()
 
 
 @router.get("/jj/log", response_model=list[JJRevision])
-async def get_jj_log(path: str | None = None, limit: int = 50):
-    _require_single_repo_mode()
-    jj = get_jj_service()
+async def get_jj_log(daemon_config: DaemonConfigDep, path: str | None = None, limit: int = 50):
+    _require_single_repo_mode(daemon_config)
+    jj = get_jj_service(daemon_config)
     return jj.get_log(path=path, limit=min(max(limit, 1), 200))
 
 
 @router.get("/jj/evolog", response_model=list[JJEvoEntry])
-async def get_jj_evolog(rev: str = "@", limit: int = 20):
-    _require_single_repo_mode()
-    jj = get_jj_service()
+async def get_jj_evolog(daemon_config: DaemonConfigDep, rev: str = "@", limit: int = 20):
+    _require_single_repo_mode(daemon_config)
+    jj = get_jj_service(daemon_config)
     return jj.get_evolog(rev=rev, limit=min(max(limit, 1), 100))
 
 
 @router.get("/jj/diff", response_model=FileDiff)
-async def get_jj_diff(rev: str, path: str | None = None):
-    _require_single_repo_mode()
-    jj = get_jj_service()
+async def get_jj_diff(daemon_config: DaemonConfigDep, rev: str, path: str | None = None):
+    _require_single_repo_mode(daemon_config)
+    jj = get_jj_service(daemon_config)
     diff = jj.get_diff(rev=rev, path=path)
     if not diff:
         raise HTTPException(status_code=404, detail="Could not generate jj diff")
@@ -600,8 +628,10 @@ async def get_jj_diff(rev: str, path: str | None = None):
 
 
 @router.get("/r/{repo}/jj/interdiff", response_model=FileDiff)
-async def get_jj_interdiff_multi(repo: str, from_rev: str, to_rev: str, path: str | None = None):
-    jj = get_jj_service(repo)
+async def get_jj_interdiff_multi(
+    daemon_config: DaemonConfigDep, repo: str, from_rev: str, to_rev: str, path: str | None = None
+):
+    jj = get_jj_service(daemon_config, repo)
     diff = jj.get_interdiff(from_rev=from_rev, to_rev=to_rev, path=path)
     if not diff:
         raise HTTPException(status_code=404, detail="No changes between these revisions")
@@ -609,9 +639,11 @@ async def get_jj_interdiff_multi(repo: str, from_rev: str, to_rev: str, path: st
 
 
 @router.get("/jj/interdiff", response_model=FileDiff)
-async def get_jj_interdiff(from_rev: str, to_rev: str, path: str | None = None):
-    _require_single_repo_mode()
-    jj = get_jj_service()
+async def get_jj_interdiff(
+    daemon_config: DaemonConfigDep, from_rev: str, to_rev: str, path: str | None = None
+):
+    _require_single_repo_mode(daemon_config)
+    jj = get_jj_service(daemon_config)
     diff = jj.get_interdiff(from_rev=from_rev, to_rev=to_rev, path=path)
     if not diff:
         raise HTTPException(status_code=404, detail="No changes between these revisions")
@@ -622,7 +654,7 @@ async def get_jj_interdiff(from_rev: str, to_rev: str, path: str | None = None):
 
 
 @router.get("/perf/diagnostics")
-async def get_perf_diagnostics(include_shape: bool = False):
+async def get_perf_diagnostics(daemon_config: DaemonConfigDep, include_shape: bool = False):
     """Return anonymized performance diagnostics.
 
     Safe to share — contains only timing data and aggregate repo shape
@@ -641,9 +673,8 @@ async def get_perf_diagnostics(include_shape: bool = False):
 
     if include_shape:
         repo_shapes: dict[str, dict[str, object]] = {}
-        daemon_cfg = get_daemon_config()
-        if daemon_cfg:
-            for i, repo_cfg in enumerate(daemon_cfg.repos):
+        if daemon_config:
+            for i, repo_cfg in enumerate(daemon_config.repos):
                 shape = await loop.run_in_executor(None, collect_repo_shape, str(repo_cfg.path))
                 repo_shapes[f"repo_{i + 1}"] = shape
         else:
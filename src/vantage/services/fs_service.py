@@ -1,5 +1,8 @@
+import functools
 import logging
 import os
+import re
+import stat
 import subprocess
 import time
 from pathlib import Path
@@ -17,12 +20,41 @@ _md_dir_cache: dict[str, tuple[float, bool]] = {}
 _MD_DIR_CACHE_TTL = 30.0  # seconds — markdown files rarely appear/disappear
 
 
+# Snapshot cache for list_directory's scandir pass, keyed on the directory
+# plus the options that shape a listing.  A snapshot is reused only while
+# the directory's st_mtime_ns is unchanged (adding, removing, or renaming an
+# entry bumps it) and within the TTL, since has_markdown can change without
+# touching the directory itself.  Listings filtered by show_gitignored=False
+# are never cached: ignore rules live in .gitignore files anywhere up the
+# tree (plus .git/info/exclude), whose edits move no directory mtime.
+_listing_cache: dict[
+    tuple[str, str, bool, frozenset[str]],
+    tuple[int, float, list[FileNode], list[str]],
+] = {}
+_LISTING_CACHE_TTL = 30.0  # seconds — matches _MD_DIR_CACHE_TTL
+# Directory mtimes are only as fine as the filesystem's clock tick, so a
+# directory modified this recently could change again without its mtime
+# moving.  Such snapshots are not cached (git's "racy index" rule).
+_LISTING_RACY_NS = 2_000_000_000
+
+
+# A ``.git`` path component, with either separator.  One C-level scan
+# instead of normalizing and splitting the path on every call.
+_GIT_COMPONENT_RE = re.compile(r"(?:^|[/\\])\.git(?:[/\\]|$)")
+
+
 def clear_md_dir_cache() -> None:
     """Flush the _dir_has_markdown cache."""
     _md_dir_cache.clear()
     logger.debug("Markdown-dir cache cleared")
 
 
+def clear_listing_cache() -> None:
+    """Flush the list_directory snapshot cache."""
+    _listing_cache.clear()
+    logger.debug("Directory listing cache cleared")
+
+
 class FileSystemService:
     def __init__(
         self,
@@ -39,6 +71,13 @@ class FileSystemService:
             exclude_dirs if exclude_dirs is not None else DEFAULT_EXCLUDE_DIRS
         )
         self.allowed_read_roots: list[Path] = [p.resolve() for p in (allowed_read_roots or [])]
+        # String forms of root_path + allowed_read_roots (with a trailing
+        # separator) for validate_path's prefix checks, so the hot path never
+        # builds Path objects.
+        self._root_str: str = str(self.root_path)
+        self._allowed_roots_str: list[str] = [
+            os.path.join(str(r), "") for r in [self.root_path, *self.allowed_read_roots]
+        ]
         self.show_hidden: bool = show_hidden
         self.show_gitignored: bool = show_gitignored
         self._git: GitService | None = None
@@ -58,36 +97,40 @@ class FileSystemService:
         - Paths into .git directory
         - Any resolved path outside root_path
         """
-        if not path or "\x00" in path:
-            raise ValueError("Invalid path")
+        error = self._classify_path(path)
+        if error is not None:
+            raise ValueError(error)
 
-        # Reject absolute paths outright
-        if path.startswith("/"):
-            raise ValueError("Absolute paths not allowed")
+        # Normalize and resolve.  os.path.realpath does the symlink walk in
+        # one call; the containment check is then plain string comparison.
+        resolved = os.path.realpath(os.path.join(self._root_str, path))
 
-        # Block access to .git internals
-        normalized = path.replace("\\", "/")
-        parts = normalized.split("/")
-        if ".git" in parts:
-            raise ValueError("Access to .git directory is not allowed")
+        # Must be root_path itself, a child of root_path, or under an allowed root
+        candidate = resolved + os.sep
+        for root in self._allowed_roots_str:
+            if candidate.startswith(root):
+                return Path(resolved)
+        raise ValueError("Path traversal detected")
 
-        # Normalize and resolve
-        full_path = (self.root_path / path).resolve()
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def _classify_path(path: str) -> str | None:
+        """Run the string-only checks of validate_path; return the error or None.
 
-        # Must be root_path itself, a child of root_path, or under an allowed root
-        try:
-            full_path.relative_to(self.root_path)
-        except ValueError:
-            for allowed_root in self.allowed_read_roots:
-                try:
-                    full_path.relative_to(allowed_root)
-                    break
-                except ValueError:
-                    continue
-            else:
-                raise ValueError("Path traversal detected") from None
+        These depend on nothing but the string, so results are cached; the
+        symlink-resolving containment check in validate_path is not.
+        """
+        if not path or "\x00" in path:
+            return "Invalid path"
+
+        # Reject absolute paths outright
+        if os.path.isabs(path):
+            return "Absolute paths not allowed"
 
-        return full_path
+        # Block access to .git internals
+        if _GIT_COMPONENT_RE.search(path):
+            return "Access to .git directory is not allowed"
+        return None
 
     @staticmethod
     def _dir_has_markdown(dir_path: Path) -> bool:
@@ -155,22 +198,37 @@ class FileSystemService:
                 ignored.add(os.path.basename(p))
         return ignored
 
-    @timed("fs", "list_directory")
-    def list_directory(self, path: str = ".", include_git: bool = False) -> list[FileNode]:
-        """List a directory's contents.
+    def _scan_directory_cached(
+        self, target_dir: Path, mtime_ns: int
+    ) -> tuple[list[FileNode], list[str]] | None:
+        """Return _scan_directory(target_dir), reusing a snapshot if still valid."""
+        if not self.show_gitignored:
+            return self._scan_directory(target_dir)
+        key = (
+            str(target_dir),
+            self._root_str,
+            self.show_hidden,
+            self.exclude_dirs,
+        )
+        now = time.monotonic()
+        cached = _listing_cache.get(key)
+        if cached is not None:
+            cached_mtime, ts, nodes, rel_paths = cached
+            if cached_mtime == mtime_ns and now - ts < _LISTING_CACHE_TTL:
+                return nodes, rel_paths
 
-        By default returns just file/folder names (fast, no git calls).
-        Set include_git=True to also fetch last_commit per entry (batch git call).
+        scanned = self._scan_directory(target_dir)
+        if scanned is not None and time.time_ns() - mtime_ns > _LISTING_RACY_NS:
+            _listing_cache[key] = (mtime_ns, now, *scanned)
+        return scanned
 
-        Symlinks are detected and annotated:
-        - Internal symlinks (target inside root_path) are shown with symlink_target set.
-        - External or broken symlinks are shown with is_symlink=True but symlink_target=None.
-        """
-        target_dir = self.validate_path(path)
-        if not target_dir.is_dir():
-            raise ValueError("Not a directory")
+    def _scan_directory(self, target_dir: Path) -> tuple[list[FileNode], list[str]] | None:
+        """Build the FileNodes for *target_dir*, without any git annotations.
 
-        nodes = []
+        Returns the nodes plus the rel_paths eligible for last_commit lookup,
+        or None if the directory cannot be read.
+        """
+        nodes: list[FileNode] = []
         rel_paths: list[str] = []
         gitignored_names = (
             self._get_gitignored_names(target_dir) if not self.show_gitignored else set()
@@ -179,120 +237,147 @@ class FileSystemService:
             scandir_iter = os.scandir(target_dir)
         except PermissionError:
             logger.debug("Permission denied listing directory: %s", target_dir)
-            return []
-        for entry in scandir_iter:
-            is_symlink = entry.is_symlink()
-
-            # For broken symlinks, is_dir() and is_file() both return False.
-            # Detect this early and handle as an error entry.
-            if is_symlink:
-                try:
-                    entry.stat()  # follows symlink — raises if broken
-                except OSError:
-                    # Broken symlink — show as error if it looks like .md or a dir
-                    name = entry.name
-                    if not self.show_hidden and name.startswith("."):
-                        continue
-                    if not self.show_gitignored and name in gitignored_names:
+            return None
+        with scandir_iter:
+            for entry in scandir_iter:
+                is_symlink = entry.is_symlink()
+
+                # For broken symlinks, is_dir() and is_file() both return False.
+                # Detect this early and handle as an error entry.
+                if is_symlink:
+                    try:
+                        entry.stat()  # follows symlink — raises if broken
+                    except OSError:
+                        # Broken symlink — show as error if it looks like .md or a dir
+                        name = entry.name
+                        if not self.show_hidden and name.startswith("."):
+                            continue
+                        if not self.show_gitignored and name in gitignored_names:
+                            continue
+                        is_markdown_name = name.lower().endswith(".md")
+                        if is_markdown_name or not name.endswith((".",)):
+                            rel_path = os.path.relpath(entry.path, self.root_path)
+                            nodes.append(
+                                FileNode(
+                                    name=name,
+                                    path=rel_path,
+                                    is_dir=not is_markdown_name,
+                                    has_markdown=False,
+                                    is_symlink=True,
+                                    symlink_target=None,
+                                )
+                            )
                         continue
-                    is_markdown_name = name.lower().endswith(".md")
-                    if is_markdown_name or not name.endswith((".",)):
+
+                is_dir = entry.is_dir()  # follows symlinks
+                is_markdown = entry.name.lower().endswith(".md")
+
+                # Skip excluded directories
+                if is_dir and entry.name in self.exclude_dirs:
+                    continue
+                # Skip hidden directories/files if configured
+                if not self.show_hidden and entry.name.startswith("."):
+                    continue
+                # Skip gitignored files/dirs if configured
+                if not self.show_gitignored and entry.name in gitignored_names:
+                    continue
+
+                symlink_target: str | None = None
+                symlink_error = False
+                if is_symlink:
+                    try:
+                        resolved = Path(entry.path).resolve()
+                        symlink_target = str(resolved.relative_to(self.root_path))
+                    except (ValueError, OSError):
+                        # Target is outside root_path or broken
+                        symlink_error = True
+
+                if is_dir:
+                    # Don't recurse into symlinked dirs pointing outside the project
+                    if is_symlink and symlink_error:
                         rel_path = os.path.relpath(entry.path, self.root_path)
                         nodes.append(
                             FileNode(
-                                name=name,
+                                name=entry.name,
                                 path=rel_path,
-                                is_dir=not is_markdown_name,
+                                is_dir=True,
                                 has_markdown=False,
                                 is_symlink=True,
                                 symlink_target=None,
                             )
                         )
-                    continue
+                        continue
 
-            is_dir = entry.is_dir()  # follows symlinks
-            is_markdown = entry.name.lower().endswith(".md")
-
-            # Skip excluded directories
-            if is_dir and entry.name in self.exclude_dirs:
-                continue
-            # Skip hidden directories/files if configured
-            if not self.show_hidden and entry.name.startswith("."):
-                continue
-            # Skip gitignored files/dirs if configured
-            if not self.show_gitignored and entry.name in gitignored_names:
-                continue
-
-            symlink_target: str | None = None
-            symlink_error = False
-            if is_symlink:
-                try:
-                    resolved = Path(entry.path).resolve()
-                    resolved.relative_to(self.root_path)
-                    symlink_target = str(resolved.relative_to(self.root_path))
-                except (ValueError, OSError):
-                    # Target is outside root_path or broken
-                    symlink_error = True
-
-            if is_dir:
-                # Don't recurse into symlinked dirs pointing outside the project
-                if is_symlink and symlink_error:
+                    has_md = self._dir_has_markdown(Path(entry.path))
                     rel_path = os.path.relpath(entry.path, self.root_path)
+                    rel_paths.append(rel_path)
                     nodes.append(
                         FileNode(
                             name=entry.name,
                             path=rel_path,
                             is_dir=True,
-                            has_markdown=False,
-                            is_symlink=True,
-                            symlink_target=None,
+                            has_markdown=has_md,
+                            last_commit=None,
+                            is_symlink=is_symlink,
+                            symlink_target=symlink_target if is_symlink else None,
                         )
                     )
-                    continue
+                elif is_markdown:
+                    # Show broken/external symlink .md files as errors (not navigable)
+                    if is_symlink and symlink_error:
+                        rel_path = os.path.relpath(entry.path, self.root_path)
+                        nodes.append(
+                            FileNode(
+                                name=entry.name,
+                                path=rel_path,
+                                is_dir=False,
+                                has_markdown=True,
+                                is_symlink=True,
+                                symlink_target=None,
+                            )
+                        )
+                        continue
 
-                has_md = self._dir_has_markdown(Path(entry.path))
-                rel_path = os.path.relpath(entry.path, self.root_path)
-                rel_paths.append(rel_path)
-                nodes.append(
-                    FileNode(
-                        name=entry.name,
-                        path=rel_path,
-                        is_dir=True,
-                        has_markdown=has_md,
-                        last_commit=None,
-                        is_symlink=is_symlink,
-                        symlink_target=symlink_target if is_symlink else None,
-                    )
-                )
-            elif is_markdown:
-                # Show broken/external symlink .md files as errors (not navigable)
-                if is_symlink and symlink_error:
                     rel_path = os.path.relpath(entry.path, self.root_path)
+                    rel_paths.append(rel_path)
                     nodes.append(
                         FileNode(
                             name=entry.name,
                             path=rel_path,
                             is_dir=False,
                             has_markdown=True,
-                            is_symlink=True,
-                            symlink_target=None,
+                            last_commit=None,
+                            is_symlink=is_symlink,
+                            symlink_target=symlink_target if is_symlink else None,
                         )
                     )
-                    continue
+        return nodes, rel_paths
 
-                rel_path = os.path.relpath(entry.path, self.root_path)
-                rel_paths.append(rel_path)
-                nodes.append(
-                    FileNode(
-                        name=entry.name,
-                        path=rel_path,
-                        is_dir=False,
-                        has_markdown=True,
-                        last_commit=None,
-                        is_symlink=is_symlink,
-                        symlink_target=symlink_target if is_symlink else None,
-                    )
-                )
+    @timed("fs", "list_directory")
+    def list_directory(self, path: str = ".", include_git: bool = False) -> list[FileNode]:
+        """List a directory's contents.
+
+        By default returns just file/folder names (fast, no git calls).
+        Set include_git=True to also fetch last_commit per entry (batch git call).
+
+        Symlinks are detected and annotated:
+        - Internal symlinks (target inside root_path) are shown with symlink_target set.
+        - External or broken symlinks are shown with is_symlink=True but symlink_target=None.
+        """
+        target_dir = self.validate_path(path)
+        try:
+            dir_stat = os.stat(target_dir)
+        except OSError:
+            dir_stat = None
+        if dir_stat is None or not stat.S_ISDIR(dir_stat.st_mode):
+            raise ValueError("Not a directory")
+
+        snapshot = self._scan_directory_cached(target_dir, dir_stat.st_mtime_ns)
+        if snapshot is None:
+            return []
+        # Copies, so the git annotations below never leak into the cache
+        nodes = [node.model_copy() for node in snapshot[0]]
+        rel_paths = snapshot[1]
 
         # Batch fetch git info in a single call instead of N individual calls
         if include_git and rel_paths:
@@ -4,13 +4,15 @@ import os
 import re
 import stat as stat_module
 import subprocess
+import threading
 import time
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
-from git import Repo
+from git import Commit, Repo
 
 from vantage.schemas.models import DiffHunk, DiffLine, FileDiff, GitCommit
 from vantage.services.perf import timed
@@ -31,6 +33,23 @@ _RECENT_FILES_TTL = 30.0  # seconds — most expensive call, staleness is accept
 _status_cache: dict[str, tuple[float, dict[str, str]]] = {}
 _STATUS_CACHE_TTL = 3.0  # seconds
 
+# LRU cache for get_last_commits_batch.  Keyed by (working_dir, HEAD sha,
+# repo-relative path): any new commit moves HEAD, so entries never go stale
+# and need no TTL.  A None value records "not in the last 500 commits".
+_last_commit_cache: OrderedDict[tuple[str, str, str], GitCommit | None] = OrderedDict()
+_LAST_COMMIT_CACHE_MAX = 2048
+# list_directory(include_git=True) runs on the executor pool, so lookups
+# (which reorder the LRU) and evictions must not interleave.
+_last_commit_lock = threading.Lock()
+
+# LRU cache for get_file_diff.  Keyed by (working_dir, resolved commit sha,
+# repo-relative path, requested path): a commit's diff against its parent
+# is content-addressed, so entries never go stale.  None records "file not
+# touched by this commit".
+_file_diff_cache: OrderedDict[tuple[str, str, str, str], FileDiff | None] = OrderedDict()
+_FILE_DIFF_CACHE_MAX = 512
+_file_diff_lock = threading.Lock()
+
 
 def clear_recent_files_cache() -> None:
     """Flush the entire recent-files cache.
@@ -175,12 +194,30 @@ class GitService:
             return child_result
 
         result: dict[str, GitCommit] = {}
-        remaining = set(paths)
-
+        repo_paths = {self._get_repo_relative_path(p): p for p in paths}
+        working_dir = str(self.repo.working_dir)
+        try:
+            head: str | None = self.repo.head.commit.hexsha
+        except Exception:
+            head = None  # unborn HEAD: nothing stable to key the cache on
+
+        if head is not None:
+            with _last_commit_lock:
+                for rel in list(repo_paths):
+                    key = (working_dir, head, rel)
+                    if key in _last_commit_cache:
+                        _last_commit_cache.move_to_end(key)
+                        cached = _last_commit_cache[key]
+                        orig = repo_paths.pop(rel)
+                        if cached is not None:
+                            result[orig] = cached
+            if not repo_paths:
+                return result
+
+        remaining = set(repo_paths.values())
         try:
             # Walk recent commits and match paths as we go
             # This is much faster than N individual git log calls
-            repo_paths = {self._get_repo_relative_path(p): p for p in paths}
             proc = subprocess.run(
                 [
                     "git",
@@ -195,7 +232,7 @@ class GitService:
                 timeout=10,
             )
             if proc.returncode != 0:
-                return {}
+                return result
 
             current_commit: GitCommit | None = None
             for line in proc.stdout.splitlines():
@@ -224,7 +261,15 @@ class GitService:
                             if not remaining:
                                 break
         except Exception:
-            pass
+            return result
+
+        # The walk finished, so every miss is a real "not found" for this HEAD
+        if head is not None:
+            with _last_commit_lock:
+                for rel, orig in repo_paths.items():
+                    _last_commit_cache[(working_dir, head, rel)] = result.get(orig)
+                while len(_last_commit_cache) > _LAST_COMMIT_CACHE_MAX:
+                    _last_commit_cache.popitem(last=False)
 
         return result
 
@@ -1003,38 +1048,53 @@ class GitService:
             commit = self.repo.commit(commit_sha)
             repo_path = self._get_repo_relative_path(path)
 
-            # Get parent commit (if exists)
-            if commit.parents:
-                parent = commit.parents[0]
-                # Get diff between parent and this commit for the specific file
-                diffs = parent.diff(commit, paths=repo_path, create_patch=True)
-            else:
-                # First commit - diff against empty tree using NULL_TREE
-                from git import NULL_TREE
-
-                diffs = commit.diff(NULL_TREE, paths=repo_path, create_patch=True)
+            key = (str(self.repo.working_dir), commit.hexsha, repo_path, path)
+            with _file_diff_lock:
+                if key in _file_diff_cache:
+                    _file_diff_cache.move_to_end(key)
+                    return _file_diff_cache[key]
+            result = self._compute_file_diff(commit, repo_path, path)
+        except Exception:
+            return None
 
-            if not diffs:
-                return None
+        with _file_diff_lock:
+            _file_diff_cache[key] = result
+            while len(_file_diff_cache) > _FILE_DIFF_CACHE_MAX:
+                _file_diff_cache.popitem(last=False)
+        return result
 
-            diff: Any = diffs[0]
-            raw_diff: str = diff.diff.decode("utf-8", errors="replace") if diff.diff else ""
+    def _compute_file_diff(self, commit: Commit, repo_path: str, path: str) -> FileDiff | None:
+        """Diff *repo_path* between *commit* and its first parent (uncached)."""
+        # Get parent commit (if exists)
+        if commit.parents:
+            parent = commit.parents[0]
+            # Get diff between parent and this commit for the specific file
+            diffs = parent.diff(commit, paths=repo_path, create_patch=True)
+        else:
+            # First commit - diff against empty tree using NULL_TREE
+            from git import NULL_TREE
 
-            # Parse the diff into hunks
-            hunks = self._parse_diff(raw_diff)
+            diffs = commit.diff(NULL_TREE, paths=repo_path, create_patch=True)
 
-            return FileDiff(
-                commit_hexsha=commit.hexsha,
-                commit_message=str(commit.summary),
-                commit_author=commit.author.name or "Unknown",
-                commit_date=datetime.fromtimestamp(commit.committed_date, tz=UTC),
-                file_path=path,
-                hunks=hunks,
-                raw_diff=raw_diff,
-            )
-        except Exception:
+        if not diffs:
             return None
 
+        diff: Any = diffs[0]
+        raw_diff: str = diff.diff.decode("utf-8", errors="replace") if diff.diff else ""
+
+        # Parse the diff into hunks
+        hunks = self._parse_diff(raw_diff)
+
+        return FileDiff(
+            commit_hexsha=commit.hexsha,
+            commit_message=str(commit.summary),
+            commit_author=commit.author.name or "Unknown",
+            commit_date=datetime.fromtimestamp(commit.committed_date, tz=UTC),
+            file_path=path,
+            hunks=hunks,
+            raw_diff=raw_diff,
+        )
+
     def get_working_dir_diff(self, path: str) -> FileDiff | None:
         """Get the uncommitted diff for a file (working directory vs HEAD).
 
@@ -2,6 +2,7 @@ import contextlib
 import logging
 from typing import Any
 
+import orjson
 from fastapi import WebSocket
 
 logger = logging.getLogger(__name__)
@@ -35,15 +36,26 @@ class ConnectionManager:
             logger.debug("WebSocket already removed from active connections")
 
     async def broadcast(self, message: dict[str, Any]):
+        await self.broadcast_bytes(orjson.dumps(message))
+
+    async def broadcast_bytes(self, payload: bytes):
+        """Send an already-serialized JSON payload to every client.
+
+        Callers encode once and the same text frame is fanned out to all
+        connections, instead of ``send_json`` re-encoding per client.
+        """
         if not self.active_connections:
             logger.info("Broadcast skipped: no active connections")
             return
 
+        # The frontend parses ``event.data`` as a string, so keep sending
+        # text frames rather than binary ones.
+        text = payload.decode()
         dead: list[WebSocket] = []
         sent = 0
         for connection in self.active_connections:
             try:
-                await connection.send_json(message)
+                await connection.send_text(text)
                 sent += 1
             except Exception:
                 logger.warning("Failed to send to WebSocket, removing dead connection")
@@ -6,11 +6,17 @@ without a backend — perfect for Cloudflare Pages, GitHub Pages, or any
 static hosting.
 """
 
-import json
+import io
+import os
 import shutil
 import subprocess
+import tarfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+import orjson
+
 from vantage.services.fs_service import FileSystemService
 from vantage.services.git_service import GitService
 
@@ -39,6 +45,16 @@ class StaticSiteBuilder:
         self.repo_name: str = repo_name or self.source_path.name
         self.fs_service: FileSystemService = FileSystemService(source_path)
         self.git_service: GitService = GitService(source_path)
+        # Output files serialized during generation, written in batches of
+        # about _FLUSH_BATCH_BYTES so peak memory doesn't grow with the site
+        self._pending_writes: list[tuple[Path, bytes]] = []
+        self._pending_bytes: int = 0
+        # Resolved by _copy_frontend; index.html is read from here
+        self._frontend_src: Path | None = None
+        # Set while build_tar runs: output goes into this archive instead
+        self._tar: tarfile.TarFile | None = None
+        self._tar_dirs: set[Path] = set()
+        self._tar_mtime: int = 0
 
     def build(self) -> None:
         """Build the static site."""
@@ -48,6 +64,39 @@ class StaticSiteBuilder:
         # Create output directory
         self.output_path.mkdir(parents=True, exist_ok=True)
 
+        self._generate_site()
+
+        print("Static site build complete!")
+
+    def build_tar(self, tar_path: Path) -> None:
+        """Build the static site as a single uncompressed tar archive.
+
+        The archive holds exactly what build() writes under output_path, with
+        member names relative to the site root, so ``tar -xf`` into a
+        directory reproduces the regular build.  Everything goes out as one
+        sequential stream instead of one file per page, tree, and diff.
+
+        Args:
+            tar_path: Path of the archive to create (overwritten if present).
+        """
+        tar_path = tar_path.resolve()
+        print(f"Building static site from {self.source_path}")
+        print(f"Output archive: {tar_path}")
+
+        tar_path.parent.mkdir(parents=True, exist_ok=True)
+        self._tar_mtime = int(time.time())
+        with tarfile.open(tar_path, "w") as tar:
+            self._tar = tar
+            try:
+                self._generate_site()
+            finally:
+                self._tar = None
+                self._tar_dirs.clear()
+
+        print("Static site archive complete!")
+
+    def _generate_site(self) -> None:
+        """Run every build step, then write out the queued files."""
         # Build or copy frontend
         self._copy_frontend()
 
@@ -60,7 +109,7 @@ class StaticSiteBuilder:
         # Generate SPA fallback for Cloudflare Pages
         self._generate_spa_config()
 
-        print("Static site build complete!")
+        self._flush_writes()
 
     def _copy_frontend(self) -> None:
         """Copy or build the frontend assets."""
@@ -92,9 +141,16 @@ class StaticSiteBuilder:
             raise ValueError(f"Frontend dist not found: {frontend_src}")
 
         print(f"Copying frontend from {frontend_src}")
+        self._frontend_src = frontend_src
 
         # Copy all frontend files
         for item in frontend_src.iterdir():
+            # Written by _inject_static_mode, with the static flag added
+            if item.name == "index.html":
+                continue
+            if self._tar is not None:
+                self._tar.add(item, arcname=item.name)
+                continue
             dest = self.output_path / item.name
             if item.is_dir():
                 if dest.exists():
@@ -106,7 +162,7 @@ class StaticSiteBuilder:
     def _generate_api_data(self) -> None:
         """Generate all static JSON files that replicate the API."""
         api_dir = self.output_path / "api"
-        api_dir.mkdir(exist_ok=True)
+        self._make_dirs(api_dir)
 
         print("Generating static API data...")
 
@@ -144,7 +200,7 @@ class StaticSiteBuilder:
     def _generate_tree_data(self, api_dir: Path) -> None:
         """Generate tree JSON for root and every subdirectory."""
         tree_dir = api_dir / "tree"
-        tree_dir.mkdir(parents=True, exist_ok=True)
+        self._make_dirs(tree_dir)
 
         # Process root and all subdirectories recursively
         self._process_tree_dir(".", tree_dir)
@@ -163,10 +219,8 @@ class StaticSiteBuilder:
         if rel_path == ".":
             self._write_json(tree_dir / "_.json", tree_data)
         else:
-            # Create subdirectories as needed: tree/docs/design.json
-            tree_file = tree_dir / f"{rel_path}.json"
-            tree_file.parent.mkdir(parents=True, exist_ok=True)
-            self._write_json(tree_file, tree_data)
+            # Subdirectories nest: tree/docs/design.json
+            self._write_json(tree_dir / f"{rel_path}.json", tree_data)
 
         # Recurse into subdirectories
         for node in nodes:
@@ -180,15 +234,13 @@ class StaticSiteBuilder:
         status_dir = api_dir / "git" / "status"
         diff_dir = api_dir / "git" / "diff"
 
-        for d in [content_dir, history_dir, status_dir, diff_dir]:
-            d.mkdir(parents=True, exist_ok=True)
+        self._make_dirs(content_dir, history_dir, status_dir, diff_dir)
 
         for file_path in all_files:
             # Content
             try:
                 content = self.fs_service.read_file(file_path)
                 out_file = content_dir / f"{file_path}.json"
-                out_file.parent.mkdir(parents=True, exist_ok=True)
                 self._write_json(out_file, content.model_dump(mode="json"))
             except Exception as e:
                 print(f"Warning: Could not process content for {file_path}: {e}")
@@ -197,14 +249,11 @@ class StaticSiteBuilder:
             # Git history
             history = self.git_service.get_history(file_path, limit=20)
             history_data = [c.model_dump(mode="json") for c in history]
-            hist_file = history_dir / f"{file_path}.json"
-            hist_file.parent.mkdir(parents=True, exist_ok=True)
-            self._write_json(hist_file, history_data)
+            self._write_json(history_dir / f"{file_path}.json", history_data)
 
             # Git status (latest commit)
             latest = self.git_service.get_last_commit(file_path)
             status_file = status_dir / f"{file_path}.json"
-            status_file.parent.mkdir(parents=True, exist_ok=True)
             if latest:
                 self._write_json(status_file, latest.model_dump(mode="json"))
             else:
@@ -215,7 +264,6 @@ class StaticSiteBuilder:
                 try:
                     diff = self.git_service.get_file_diff(file_path, commit.hexsha)
                     diff_file = diff_dir / file_path / f"{commit.hexsha}.json"
-                    diff_file.parent.mkdir(parents=True, exist_ok=True)
                     if diff:
                         self._write_json(diff_file, diff.model_dump(mode="json"))
                     else:
@@ -228,11 +276,13 @@ class StaticSiteBuilder:
         """Inject static mode flag and rewrite asset paths to relative."""
         import re
 
-        index_html = self.output_path / "index.html"
-        if not index_html.exists():
+        if self._frontend_src is None:
+            return
+        index_src = self._frontend_src / "index.html"
+        if not index_src.exists():
             return
 
-        content = index_html.read_text()
+        content = index_src.read_text()
 
         # Inject static mode script tag
         static_script = "<script>window.__VANTAGE_STATIC__=true;</script>"
@@ -253,10 +303,11 @@ class StaticSiteBuilder:
         # Remove any existing <base href> tag
         content = re.sub(r'\s*<base href="[^"]*"\s*/?>', "", content)
 
-        index_html.write_text(content)
+        data = content.encode()
+        self._queue_write(self.output_path / "index.html", data)
 
         # Copy index.html as 404.html — serves as error page on S3/GH Pages
-        shutil.copy2(index_html, self.output_path / "404.html")
+        self._queue_write(self.output_path / "404.html", data)
 
     def _generate_spa_config(self) -> None:
         """Generate Cloudflare Pages SPA routing config."""
@@ -264,7 +315,7 @@ class StaticSiteBuilder:
         # Cloudflare Pages serves static files first, then applies _redirects
         # So /api/tree/_.json will be served as-is, and /docs/foo.md hits the SPA
         redirects = "/*  /index.html  200\n"
-        (self.output_path / "_redirects").write_text(redirects)
+        self._queue_write(self.output_path / "_redirects", redirects.encode())
 
         # _headers for security and caching
         headers = """/*
@@ -278,13 +329,91 @@ class StaticSiteBuilder:
 /assets/*
   Cache-Control: public, max-age=31536000, immutable
 """
-        (self.output_path / "_headers").write_text(headers)
+        self._queue_write(self.output_path / "_headers", headers.encode())
+
+    def _make_dirs(self, *dirs: Path) -> None:
+        """Create output directories (or their archive members in tar mode)."""
+        for d in dirs:
+            if self._tar is not None:
+                self._add_tar_dir(d)
+            else:
+                d.mkdir(parents=True, exist_ok=True)
+
+    def _write_json(self, path: Path, data: object) -> None:
+        """Serialize data as JSON now and queue the file for _flush_writes."""
+        self._queue_write(path, orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2))
+
+    def _queue_write(self, path: Path, data: bytes) -> None:
+        """Queue an output file under output_path, flushing once a batch fills."""
+        self._pending_writes.append((path, data))
+        self._pending_bytes += len(data)
+        if self._pending_bytes >= _FLUSH_BATCH_BYTES:
+            self._flush_writes()
+
+    def _flush_writes(self) -> None:
+        """Write every queued output file.
+
+        Runs whenever a batch fills and once more at the end of the build.
+        A build emits one small file per directory, file, and commit diff, so
+        the writes are overlapped on a thread pool; serialization already
+        happened when the file was queued, leaving the workers pure I/O.  In
+        tar mode they are appended to the archive stream instead.
+        """
+        pending, self._pending_writes = self._pending_writes, []
+        self._pending_bytes = 0
+        if not pending:
+            return
+        if self._tar is not None:
+            for path, data in pending:
+                self._add_tar_dir(path.parent)
+                info = self._tar_info(path)
+                info.size = len(data)
+                self._tar.addfile(info, io.BytesIO(data))
+            return
+        # Create each distinct directory once up front so the workers only
+        # open/write/close, instead of a mkdir per file.
+        for parent in {path.parent for path, _ in pending}:
+            parent.mkdir(parents=True, exist_ok=True)
+        workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() drains the iterator so worker exceptions propagate
+            list(pool.map(lambda item: _write_bytes(*item), pending))
+
+    def _tar_info(self, path: Path) -> tarfile.TarInfo:
+        """Return a regular-file TarInfo for output *path*, named from the site root."""
+        info = tarfile.TarInfo(path.relative_to(self.output_path).as_posix())
+        info.mtime = self._tar_mtime
+        return info
+
+    def _add_tar_dir(self, path: Path) -> None:
+        """Add archive directory members for *path* and any missing parents."""
+        if self._tar is None or path == self.output_path or path in self._tar_dirs:
+            return
+        self._add_tar_dir(path.parent)
+        info = self._tar_info(path)
+        info.type = tarfile.DIRTYPE
+        info.mode = 0o755
+        self._tar.addfile(info)
+        self._tar_dirs.add(path)
+
+
+# Queued output bytes that trigger a flush mid-build.  Big enough that each
+# batch still spans many files for the thread pool, small enough that a
+# large repo's content and diffs are never all held in memory at once.
+_FLUSH_BATCH_BYTES = 8 * 1024 * 1024
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_CLOEXEC", 0)
+
 
-    @staticmethod
-    def _write_json(path: Path, data: object) -> None:
-        """Write data as JSON to a file."""
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(json.dumps(data, indent=2, default=str))
+def _write_bytes(path: Path, data: bytes) -> None:
+    """Write *data* to *path* with raw open/write/close (parent must exist)."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
 
 
 def build_static_site(
@@ -292,14 +421,19 @@ def build_static_site(
     output: Path,
     frontend_dist: Path | None = None,
     repo_name: str | None = None,
+    tar: bool = False,
 ) -> None:
     """Build a static site from a markdown repository.
 
     Args:
         source: Path to the source repository.
-        output: Path to the output directory.
+        output: Path to the output directory (or archive, with tar=True).
         frontend_dist: Optional path to pre-built frontend dist.
         repo_name: Optional name for the repo.
+        tar: Write the site as a single tar archive at output instead.
     """
     builder = StaticSiteBuilder(source, output, frontend_dist, repo_name)
-    builder.build()
+    if tar:
+        builder.build_tar(output)
+    else:
+        builder.build()
@@ -6,8 +6,11 @@ import time
 from pathlib import Path
 from typing import override
 
+import orjson
 from watchfiles import Change, DefaultFilter, watch
 
+from vantage.services.fs_service import clear_listing_cache, clear_md_dir_cache
+from vantage.services.git_service import clear_recent_files_cache, clear_status_cache
 from vantage.services.socket_manager import manager
 from vantage.settings import get_daemon_config, settings
 
@@ -121,13 +124,22 @@ _WATCHED_EXTENSIONS = {".md"}
 # merge, checkout, rebase, etc.).  Watching these lets us refresh the
 # "recently changed" list after ``git commit`` even though no ``.md``
 # file content actually changed on disk.
-_GIT_STATE_FILES = {"index", "HEAD", "MERGE_HEAD", "REBASE_HEAD", "CHERRY_PICK_HEAD"}
+_GIT_STATE_FILES = frozenset({"index", "HEAD", "MERGE_HEAD", "REBASE_HEAD", "CHERRY_PICK_HEAD"})
 
 # Quiet period: wait this long after last change before broadcasting,
 # to coalesce rapid bursts like git branch switches.
 _QUIET_PERIOD_S = 0.1
 # Maximum time before forced broadcast even if changes keep arriving.
 _MAX_WAIT_S = 1.0
+# Minimum spacing between flushes for the same repo, so a tight write
+# loop can't trigger back-to-back cache invalidation + broadcast.
+_MIN_FLUSH_INTERVAL = 0.25
+# Batches larger than this are broadcast unsorted.
+_SORT_PATHS_MAX = 100
+
+# Loop time of the last (or next already-scheduled) broadcast per repo
+# (None = single-repo mode).
+_last_flush: dict[str | None, float] = {}
 
 
 class _GitAwareFilter(DefaultFilter):
@@ -144,45 +156,60 @@ class _GitAwareFilter(DefaultFilter):
     def __call__(self, change: Change, path: str) -> bool:
         # Fast path: let the default filter handle non-.git paths
         parts = path.replace("\\", "/").split("/")
-        # Check if any path component is ".git"
+        # Check if any path component is ".git" (list.index scans in C)
         try:
-            git_idx = next(i for i, p in enumerate(parts) if p == ".git")
-        except StopIteration:
+            git_idx = parts.index(".git")
+        except ValueError:
             return super().__call__(change, path)
         # Allow .git/<state_file> (exactly one level deep); reject rest.
         return len(parts) == git_idx + 2 and parts[-1] in _GIT_STATE_FILES
 
 
-def _is_relevant(path: str) -> bool:
-    """Check if a changed file is relevant for live-reload."""
+def _classify(path: str) -> tuple[bool, bool]:
+    """Classify a changed path as ``(is_relevant, is_git_state_change)``.
+
+    Relevant paths are live-reload content (``.md`` files) or git state
+    files (commits, branch switches, etc.).  Doing both checks in one pass
+    lets the watch loops record git state changes as they arrive instead
+    of rescanning the whole batch at flush time.
+    """
     lower = path.lower()
     if any(lower.endswith(ext) for ext in _WATCHED_EXTENSIONS):
-        return True
-    # Detect git state changes (commits, branch switches, etc.)
+        return True, False
     parts = path.replace("\\", "/").split("/")
-    return len(parts) >= 2 and parts[0] == ".git" and parts[-1] in _GIT_STATE_FILES
-
-
-def _is_git_state_change(path: str) -> bool:
-    """Return True if the path is a git state file (not a .md content change)."""
-    parts = path.replace("\\", "/").split("/")
-    return len(parts) >= 2 and parts[0] == ".git" and parts[-1] in _GIT_STATE_FILES
+    is_git_state = len(parts) >= 2 and parts[0] == ".git" and parts[-1] in _GIT_STATE_FILES
+    return is_git_state, is_git_state
 
 
 async def _coalesce_and_broadcast(
     pending: set[str],
     repo_name: str | None = None,
+    has_git_change: bool = False,
 ) -> None:
-    """Send a single batched message for accumulated paths."""
+    """Send a single batched message for accumulated paths.
+
+    *has_git_change* is set by the caller when any pending path is a git
+    state file (see ``_classify``).
+    """
     if not pending:
         return
 
+    loop = asyncio.get_running_loop()
+    # Claim the send slot before sleeping.  Shielded flushes can outlive
+    # their quiet task and overlap, so each one must see the slots already
+    # taken; otherwise two flushes wake together, or out of order.
+    now = loop.time()
+    send_at = max(now, _last_flush.get(repo_name, float("-inf")) + _MIN_FLUSH_INTERVAL)
+    _last_flush[repo_name] = send_at
+    if send_at > now:
+        await asyncio.sleep(send_at - now)
+
     # Always invalidate git-status cache on any file change — working
     # directory status reflects file state, not just git state.
-    from vantage.services.fs_service import clear_md_dir_cache
-    from vantage.services.git_service import clear_recent_files_cache, clear_status_cache
-
     clear_status_cache()
+    # Directory mtimes already invalidate listings on add/remove; this also
+    # refreshes has_markdown for .md files added or removed deeper down.
+    clear_listing_cache()
 
     # If a .md file was added or removed, clear the dir-has-markdown cache
     if any(p.lower().endswith(".md") for p in pending):
@@ -190,20 +217,28 @@ async def _coalesce_and_broadcast(
 
     # If any pending path is a git state file, also invalidate the
     # recent-files cache so the next API call returns fresh data.
-    has_git_change = any(_is_git_state_change(p) for p in pending)
     if has_git_change:
         clear_recent_files_cache()
         logger.debug("Cleared recent-files + git-status caches due to git state change")
 
-    unique_paths = sorted(pending)
+    # Path order is not part of the websocket protocol.  Small batches are
+    # sorted so logs and tests stay deterministic; large bursts (branch
+    # switches touching thousands of files) skip the O(n log n) sort.
+    unique_paths = list(pending) if len(pending) > _SORT_PATHS_MAX else sorted(pending)
     msg: dict[str, object] = {"type": "files_changed", "paths": unique_paths}
     if repo_name:
         msg["repo"] = repo_name
-        logger.info(f"Batch ({repo_name}): {len(unique_paths)} file(s) changed")
+        logger.info("Batch (%s): %d file(s) changed", repo_name, len(unique_paths))
     else:
-        logger.info(f"Batch: {len(unique_paths)} file(s) changed")
-    logger.debug("Changed paths: %s", unique_paths)
-    await manager.broadcast(msg)
+        logger.info("Batch: %d file(s) changed", len(unique_paths))
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Changed paths: %s", unique_paths)
+    # Encode once per batch; the manager fans the same bytes out to
+    # every subscriber.
+    await manager.broadcast_bytes(orjson.dumps(msg))
+    # Measure spacing from the broadcast end, unless a later flush has
+    # already claimed a slot beyond it.
+    _last_flush[repo_name] = max(_last_flush[repo_name], loop.time())
 
 
 async def watch_repo():
@@ -212,7 +247,7 @@ async def watch_repo():
     Uses the synchronous ``watch()`` in a daemon thread so that the
     (potentially slow) inotify initialization never blocks the event loop.
     """
-    logger.info(f"Starting watcher for {settings.target_repo}")
+    logger.info("Starting watcher for %s", settings.target_repo)
     _log_inotify_limits()
     target = settings.target_repo.resolve()
 
@@ -245,15 +280,18 @@ async def watch_repo():
     thread.start()
 
     pending: set[str] = set()
+    git_state_pending = False
     quiet_task: asyncio.Task[None] | None = None
     batch_start: float | None = None
 
     async def flush() -> None:
-        nonlocal batch_start
+        nonlocal batch_start, git_state_pending
         paths = set(pending)
+        has_git_change = git_state_pending
         pending.clear()
+        git_state_pending = False
         batch_start = None
-        await _coalesce_and_broadcast(paths)
+        await _coalesce_and_broadcast(paths, has_git_change=has_git_change)
 
     while True:
         changes = await queue.get()
@@ -262,8 +300,10 @@ async def watch_repo():
                 rel_path = str(Path(abs_path).relative_to(target))
             except ValueError:
                 continue
-            if _is_relevant(rel_path):
+            relevant, is_git_state = _classify(rel_path)
+            if relevant:
                 pending.add(rel_path)
+                git_state_pending = git_state_pending or is_git_state
 
         if not pending:
             continue
@@ -281,7 +321,9 @@ async def watch_repo():
 
             async def _delayed_flush() -> None:
                 await asyncio.sleep(_QUIET_PERIOD_S)
-                await flush()
+                # Shield the flush itself: pending has already been drained
+                # into it, so cancelling mid-broadcast would drop paths.
+                await asyncio.shield(flush())
 
             quiet_task = asyncio.create_task(_delayed_flush())
 
@@ -305,15 +347,18 @@ async def watch_multi_repo():
 
     loop = asyncio.get_running_loop()
     pending: dict[str, set[str]] = {}  # repo_name -> paths
+    git_state_pending: set[str] = set()  # repo names with a git state change
     batch_start: float | None = None
 
     async def flush() -> None:
         nonlocal batch_start
         snapshot = {k: set(v) for k, v in pending.items()}
+        git_snapshot = set(git_state_pending)
         pending.clear()
+        git_state_pending.clear()
         batch_start = None
         for repo_name, paths in snapshot.items():
-            await _coalesce_and_broadcast(paths, repo_name)
+            await _coalesce_and_broadcast(paths, repo_name, repo_name in git_snapshot)
 
     while True:
         _watcher_stop_event.clear()
@@ -378,8 +423,11 @@ async def watch_multi_repo():
                         rel_path = str(abs_path_obj.relative_to(repo_path))
                     except ValueError:
                         continue
-                    if _is_relevant(rel_path):
+                    relevant, is_git_state = _classify(rel_path)
+                    if relevant:
                         pending.setdefault(name, set()).add(rel_path)
+                        if is_git_state:
+                            git_state_pending.add(name)
                     break
 
             if not pending:
@@ -398,7 +446,7 @@ async def watch_multi_repo():
 
                 async def _delayed_flush() -> None:
                     await asyncio.sleep(_QUIET_PERIOD_S)
-                    await flush()
+                    await asyncio.shield(flush())
 
                 quiet_task = asyncio.create_task(_delayed_flush())
 
@@ -101,6 +101,42 @@ def test_build_command_actually_runs(tmp_path):
     assert output.exists(), "build command did not create output directory"
 
 
+def _write_build_inputs(tmp_path):
+    """Create a one-file repo and a mock frontend dist under *tmp_path*."""
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    (repo / "README.md").write_text("# hello\n")
+    dist = tmp_path / "dist"
+    dist.mkdir()
+    (dist / "index.html").write_text("<html><head></head><body></body></html>")
+    return repo, dist
+
+
+def test_build_tar_can_overwrite_previous_archive(tmp_path):
+    """`vantage build --tar` must accept an existing archive at --output."""
+    repo, dist = _write_build_inputs(tmp_path)
+    archive = tmp_path / "site.tar"
+    args = ["build", str(repo), "-o", str(archive), "--frontend-dist", str(dist), "--tar"]
+
+    for _ in range(2):
+        result = CliRunner().invoke(cli, args)
+        assert result.exit_code == 0, result.output
+        assert archive.is_file()
+
+
+def test_build_tar_rejects_directory_output(tmp_path):
+    """--tar with an existing directory at --output is a usage error, not a crash."""
+    repo, dist = _write_build_inputs(tmp_path)
+    out = tmp_path / "out"
+    out.mkdir()
+
+    result = CliRunner().invoke(
+        cli, ["build", str(repo), "-o", str(out), "--frontend-dist", str(dist), "--tar"]
+    )
+    assert result.exit_code == 2
+    assert "is a directory" in result.output
+
+
 @pytest.mark.skipif(sys.platform != "linux", reason="install-service is Linux/systemd-specific")
 def test_install_service_command_actually_runs(tmp_path, monkeypatch):
     """End-to-end invocation of `vantage install-service` with ``--user``.
@@ -1,14 +1,36 @@
+import os
+import shutil
+import subprocess
+import time
+from pathlib import Path
+from unittest.mock import patch
+
 import pytest
 
 from vantage.services.fs_service import FileSystemService
 
 
+def _materialize(tree: dict[str, str | None], root: Path) -> None:
+    """Create files (str content) and directories (None) under *root*.
+
+    Each distinct parent directory is created once, no matter how many
+    entries live under it.
+    """
+    made: set[Path] = set()
+    for rel, content in tree.items():
+        target = root / rel
+        parent = target if content is None else target.parent
+        if parent not in made:
+            parent.mkdir(parents=True, exist_ok=True)
+            made.add(parent)
+        if content is not None:
+            target.write_text(content)
+
+
 @pytest.fixture
 def temp_repo(tmp_path):
     # Create a dummy repo structure
-    (tmp_path / "file1.md").write_text("content1")
-    (tmp_path / "subdir").mkdir()
-    (tmp_path / "subdir" / "file2.md").write_text("content2")
+    _materialize({"file1.md": "content1", "subdir/file2.md": "content2"}, tmp_path)
     return tmp_path
 
 
@@ -20,6 +42,40 @@ def test_list_directory(temp_repo):
     assert any(n.name == "subdir" and n.is_dir for n in nodes)
 
 
+def test_list_directory_reuses_unchanged_snapshot(temp_repo):
+    # Backdate the directory so its mtime is outside the racy window
+    old = time.time() - 60
+    os.utime(temp_repo, (old, old))
+    fs = FileSystemService(temp_repo)
+    with patch("vantage.services.fs_service.os.scandir", wraps=os.scandir) as scandir:
+        first = fs.list_directory(".")
+        calls = scandir.call_count
+        second = fs.list_directory(".")
+        assert scandir.call_count == calls
+        assert second == first
+
+        # Adding an entry bumps the directory mtime and forces a rescan
+        (temp_repo / "new.md").write_text("new")
+        third = fs.list_directory(".")
+        assert scandir.call_count > calls
+    assert any(n.name == "new.md" for n in third)
+
+
+@pytest.mark.skipif(shutil.which("git") is None, reason="git CLI not installed")
+def test_list_directory_sees_gitignore_edit(tmp_path):
+    """Editing .gitignore in place (no directory mtime change) takes effect at once."""
+    subprocess.run(["git", "init", "-q", str(tmp_path)], check=True)
+    _materialize({".gitignore": "a.md\n", "a.md": "a", "b.md": "b"}, tmp_path)
+    old = time.time() - 60
+    os.utime(tmp_path, (old, old))
+    fs = FileSystemService(tmp_path, show_gitignored=False)
+
+    assert {n.name for n in fs.list_directory(".")} == {"b.md"}
+    (tmp_path / ".gitignore").write_text("a.md\nb.md\n")
+    os.utime(tmp_path, (old, old))
+    assert {n.name for n in fs.list_directory(".")} == set()
+
+
 def test_read_file(temp_repo):
     fs = FileSystemService(temp_repo)
     content = fs.read_file("file1.md")
@@ -58,11 +114,9 @@ def test_validate_path_empty(temp_repo):
 
 
 def test_validate_path_allows_symlink_target_within_allowed_read_roots(tmp_path):
+    _materialize({"repo": None, "allowed/allowed.md": "allowed content"}, tmp_path)
     repo_root = tmp_path / "repo"
-    repo_root.mkdir()
     allowed_root = tmp_path / "allowed"
-    allowed_root.mkdir()
-    (allowed_root / "allowed.md").write_text("allowed content")
     (repo_root / "link.md").symlink_to(allowed_root / "allowed.md")
 
     fs = FileSystemService(repo_root, allowed_read_roots=[allowed_root])
@@ -72,13 +126,10 @@ def test_validate_path_allows_symlink_target_within_allowed_read_roots(tmp_path)
 
 
 def test_validate_path_rejects_symlink_target_outside_allowed_read_roots(tmp_path):
+    _materialize({"repo": None, "allowed": None, "blocked/blocked.md": "blocked content"}, tmp_path)
     repo_root = tmp_path / "repo"
-    repo_root.mkdir()
     allowed_root = tmp_path / "allowed"
-    allowed_root.mkdir()
     blocked_root = tmp_path / "blocked"
-    blocked_root.mkdir()
-    (blocked_root / "blocked.md").write_text("blocked content")
     (repo_root / "link.md").symlink_to(blocked_root / "blocked.md")
 
     fs = FileSystemService(repo_root, allowed_read_roots=[allowed_root])
@@ -88,13 +139,14 @@ def test_validate_path_rejects_symlink_target_outside_allowed_read_roots(tmp_pat
 
 def test_list_directory_has_markdown(tmp_path):
     """Directories without .md files should appear with has_markdown=False."""
-    (tmp_path / "docs").mkdir()
-    (tmp_path / "docs" / "readme.md").write_text("hello")
-    (tmp_path / "empty_dir").mkdir()
-    (tmp_path / "empty_dir" / "data.txt").write_text("nope")
-    (tmp_path / "nested").mkdir()
-    (tmp_path / "nested" / "deep").mkdir()
-    (tmp_path / "nested" / "deep" / "found.md").write_text("yes")
+    _materialize(
+        {
+            "docs/readme.md": "hello",
+            "empty_dir/data.txt": "nope",
+            "nested/deep/found.md": "yes",
+        },
+        tmp_path,
+    )
 
     fs = FileSystemService(tmp_path)
     nodes = fs.list_directory(".")
@@ -108,11 +160,14 @@ def test_list_directory_has_markdown(tmp_path):
 
 def test_list_directory_hidden_markdown(tmp_path):
     """Hidden directories with .md files and hidden .md files should be shown."""
-    (tmp_path / ".hidden_dir").mkdir()
-    (tmp_path / ".hidden_dir" / "notes.md").write_text("secret notes")
-    (tmp_path / ".hidden.md").write_text("hidden markdown")
-    (tmp_path / ".no_md_dir").mkdir()
-    (tmp_path / ".no_md_dir" / "data.txt").write_text("nope")
+    _materialize(
+        {
+            ".hidden_dir/notes.md": "secret notes",
+            ".hidden.md": "hidden markdown",
+            ".no_md_dir/data.txt": "nope",
+        },
+        tmp_path,
+    )
 
     fs = FileSystemService(tmp_path)
     nodes = fs.list_directory(".")
@@ -149,8 +204,7 @@ def test_list_directory_internal_file_symlink(tmp_path):
 
 def test_list_directory_internal_dir_symlink(tmp_path):
     """Symlinks to directories inside the project are shown with is_symlink and target."""
-    (tmp_path / "real_dir").mkdir()
-    (tmp_path / "real_dir" / "doc.md").write_text("hello")
+    _materialize({"real_dir/doc.md": "hello"}, tmp_path)
     (tmp_path / "link_dir").symlink_to(tmp_path / "real_dir")
 
     fs = FileSystemService(tmp_path)
@@ -168,11 +222,9 @@ def test_list_directory_internal_dir_symlink(tmp_path):
 
 def test_list_directory_external_symlink_file(tmp_path):
     """Symlinks to files outside the project are shown as errors."""
+    _materialize({"repo": None, "external/secret.md": "secret"}, tmp_path)
     repo = tmp_path / "repo"
-    repo.mkdir()
     external = tmp_path / "external"
-    external.mkdir()
-    (external / "secret.md").write_text("secret")
     (repo / "link.md").symlink_to(external / "secret.md")
 
     fs = FileSystemService(repo)
@@ -186,10 +238,9 @@ def test_list_directory_external_symlink_file(tmp_path):
 
 def test_list_directory_external_symlink_dir(tmp_path):
     """Symlinks to directories outside the project are shown as errors."""
+    _materialize({"repo": None, "external": None}, tmp_path)
     repo = tmp_path / "repo"
-    repo.mkdir()
     external = tmp_path / "external"
-    external.mkdir()
     (repo / "link_dir").symlink_to(external)
 
     fs = FileSystemService(repo)
@@ -1,56 +1,102 @@
 """Tests for GitService."""
 
+import os
+import shutil
 import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from subprocess import DEVNULL
 
+import pygit2
 import pytest
+from watchfiles import Change
 
-from vantage.services.git_service import GitService
+from vantage.services.git_service import GitService, clear_recent_files_cache
 
+# Repos are built in-process with pygit2 rather than by shelling out to
+# ``git add`` / ``git commit``; the fork+exec per call dominated this file.
+_SIGNATURE = pygit2.Signature("Test User", "test@example.com")
 
-@pytest.fixture
-def git_repo(tmp_path):
-    """Create a temporary git repository with some commits."""
-    repo_path = tmp_path / "repo"
-    repo_path.mkdir()
 
-    # Initialize git repo
-    subprocess.run(["git", "init"], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
+def _init_repo(path):
+    """Init a repo at *path* with the test identity configured; returns *path*."""
+    repo = pygit2.init_repository(str(path))
+    repo.config["user.email"] = _SIGNATURE.email
+    repo.config["user.name"] = _SIGNATURE.name
+    return path
+
+
+def _stage(repo_path, *paths):
+    """Stage existing files in-process (``git add <paths>``)."""
+    index = pygit2.Repository(str(repo_path)).index
+    for path in paths:
+        index.add(path)
+    index.write()
+
+
+def _make_commit(repo_path, message, files=None, when=None):
+    """Write *files* (``{relpath: content}``), stage them, and commit the index.
+
+    With no *files*, commits whatever is already staged.  *when* pins the
+    commit timestamp (epoch seconds).  Returns the new commit id.
+    """
+    repo = pygit2.Repository(str(repo_path))
+    index = repo.index
+    for rel, content in (files or {}).items():
+        target = Path(repo_path) / rel
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text(content)
+        index.add(rel)
+    index.write()
+    tree = index.write_tree()
+    parents = [] if repo.head_is_unborn else [repo.head.target]
+    sig = _SIGNATURE if when is None else pygit2.Signature(_SIGNATURE.name, _SIGNATURE.email, when)
+    return repo.create_commit("HEAD", sig, sig, message, tree, parents)
+
+
+@pytest.fixture(autouse=True)
+def _clear_git_cache():
+    """Start and end every test with an empty recent-files cache."""
+    clear_recent_files_cache()
+    yield
+    clear_recent_files_cache()
+
+
+@pytest.fixture(scope="session")
+def _git_repo_template(tmp_path_factory):
+    """Build the two-commit baseline repo once; tests get copies via git_repo."""
+    repo_path = _init_repo(tmp_path_factory.mktemp("tpl") / "repo")
 
     # Create initial file and commit
-    (repo_path / "README.md").write_text("# Initial content\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Initial commit"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
-    )
+    _make_commit(repo_path, "Initial commit", {"README.md": "# Initial content\n"})
 
     # Modify file and commit again
-    (repo_path / "README.md").write_text("# Updated content\n\nMore text here.\n")
-    subprocess.run(["git", "add", "."], cwd=repo_path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Update README"],
-        cwd=repo_path,
-        check=True,
-        capture_output=True,
+    _make_commit(
+        repo_path, "Update README", {"README.md": "# Updated content\n\nMore text here.\n"}
     )
 
     return repo_path
 
 
+@pytest.fixture(scope="session")
+def git_base(tmp_path_factory):
+    """One session directory holding every test's repo copy, keyed by test name."""
+    return tmp_path_factory.mktemp("gitrepos")
+
+
+@pytest.fixture
+def bare_repo(tmp_path):
+    """An initialised repo with no commits, for error-path tests."""
+    return _init_repo(tmp_path / "repo")
+
+
+@pytest.fixture
+def git_repo(git_base, request, _git_repo_template):
+    """Create a temporary git repository with some commits."""
+    return shutil.copytree(_git_repo_template, git_base / request.node.name, symlinks=True)
+
+
 def test_git_service_no_repo(tmp_path):
     """Test GitService when not in a git repository."""
     service = GitService(tmp_path)
@@ -63,6 +109,30 @@ def test_git_service_with_repo(git_repo):
     assert service.repo is not None
 
 
+@pytest.mark.skipif(shutil.which("git") is None, reason="git CLI not installed")
+def test_git_cli_created_repo(tmp_path):
+    """Smoke test: a repo written by the real git CLI reads like the pygit2 ones.
+
+    Every other fixture builds repos in-process, so this is the one test that
+    exercises what ``git init``/``add``/``commit`` put on disk.
+    """
+    repo_path = tmp_path / "cli_repo"
+    repo_path.mkdir()
+    (repo_path / "README.md").write_text("# CLI\n")
+    for args in (
+        ["init"],
+        ["config", "user.email", "test@example.com"],
+        ["config", "user.name", "Test User"],
+        ["add", "README.md"],
+        ["commit", "-m", "CLI commit"],
+    ):
+        subprocess.run(["git", *args], cwd=repo_path, check=True, stdout=DEVNULL, stderr=DEVNULL)
+
+    history = GitService(repo_path).get_history("README.md")
+    assert [c.message for c in history] == ["CLI commit"]
+    assert history[0].author_name == "Test User"
+
+
 def test_get_history(git_repo):
     """Test getting git history for a file."""
     service = GitService(git_repo)
@@ -101,9 +171,9 @@ def test_get_last_commit(git_repo):
     assert commit.author_email == "test@example.com"
 
 
-def test_get_last_commit_no_commits(git_repo):
+def test_get_last_commit_no_commits(bare_repo):
     """Test getting last commit for a file with no commits."""
-    service = GitService(git_repo)
+    service = GitService(bare_repo)
     # Query a file that doesn't exist
     commit = service.get_last_commit("nonexistent.md")
 
@@ -146,6 +216,45 @@ def test_get_file_diff_initial_commit(git_repo):
     assert len(diff.hunks) > 0
 
 
+def test_get_file_diff_cached_per_commit(git_repo, monkeypatch):
+    """A repeat diff for the same file and commit reuses the first result."""
+    service = GitService(git_repo)
+    commit_sha = service.get_history("README.md", limit=1)[0].hexsha
+    calls: list[str] = []
+    compute = GitService._compute_file_diff
+
+    def _counting(self, commit, repo_path, path):
+        calls.append(path)
+        return compute(self, commit, repo_path, path)
+
+    monkeypatch.setattr(GitService, "_compute_file_diff", _counting)
+    first = service.get_file_diff("README.md", commit_sha)
+    assert first is not None
+    assert service.get_file_diff("README.md", commit_sha) is first
+    # An abbreviated sha resolves to the same commit, hence the same entry
+    assert service.get_file_diff("README.md", commit_sha[:7]) is first
+    assert calls == ["README.md"]
+
+
+def test_get_last_commits_batch_cached_per_head(git_repo, monkeypatch):
+    """A repeat batch at the same HEAD skips git log; a new commit recomputes."""
+    service = GitService(git_repo)
+    first = service.get_last_commits_batch(["README.md", "missing.md"])
+    assert first["README.md"].message == "Update README"
+    assert "missing.md" not in first
+
+    def _no_git_log(*_args, **_kwargs):
+        raise AssertionError("git log ran despite a warm cache")
+
+    monkeypatch.setattr("vantage.services.git_service.subprocess.run", _no_git_log)
+    assert service.get_last_commits_batch(["README.md", "missing.md"]) == first
+    monkeypatch.undo()
+
+    _make_commit(git_repo, "Touch README", {"README.md": "# Touched\n"})
+    again = service.get_last_commits_batch(["README.md"])
+    assert again["README.md"].message == "Touch README"
+
+
 def test_get_file_diff_no_repo(tmp_path):
     """Test getting a diff when not in a repo."""
     service = GitService(tmp_path)
@@ -154,9 +263,9 @@ def test_get_file_diff_no_repo(tmp_path):
     assert diff is None
 
 
-def test_get_file_diff_invalid_commit(git_repo):
+def test_get_file_diff_invalid_commit(bare_repo):
     """Test getting a diff with an invalid commit SHA."""
-    service = GitService(git_repo)
+    service = GitService(bare_repo)
     diff = service.get_file_diff("README.md", "invalid_sha")
 
     assert diff is None
@@ -188,24 +297,15 @@ def test_recently_changed_files_excludes_node_modules(git_repo):
     """Test that node_modules and other excluded directories are filtered from recent files."""
     service = GitService(git_repo)
 
-    # Create some files in various directories
-    (git_repo / "src").mkdir()
-    (git_repo / "src" / "main.md").write_text("# Main")
-
-    (git_repo / "node_modules").mkdir()
-    (git_repo / "node_modules" / "pkg").mkdir()
-    (git_repo / "node_modules" / "pkg" / "README.md").write_text("# Package")
-
-    (git_repo / ".venv").mkdir()
-    (git_repo / ".venv" / "lib.md").write_text("# Venv file")
-
-    # Commit all files
-    subprocess.run(["git", "add", "."], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add files in various dirs"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
+    # Create and commit files in various directories
+    _make_commit(
+        git_repo,
+        "Add files in various dirs",
+        {
+            "src/main.md": "# Main",
+            "node_modules/pkg/README.md": "# Package",
+            ".venv/lib.md": "# Venv file",
+        },
     )
 
     recent = service.get_recently_changed_files(limit=30)
@@ -224,21 +324,11 @@ def test_recently_changed_files_custom_exclude_dirs(git_repo):
     # Only exclude 'vendor', not node_modules
     service = GitService(git_repo, exclude_dirs=frozenset({"vendor"}))
 
-    # Create some files
-    (git_repo / "node_modules").mkdir()
-    (git_repo / "node_modules" / "pkg").mkdir()
-    (git_repo / "node_modules" / "pkg" / "README.md").write_text("# Package")
-
-    (git_repo / "vendor").mkdir()
-    (git_repo / "vendor" / "lib.md").write_text("# Vendor lib")
-
-    # Commit all files
-    subprocess.run(["git", "add", "."], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add vendor and node_modules"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
+    # Create and commit some files
+    _make_commit(
+        git_repo,
+        "Add vendor and node_modules",
+        {"node_modules/pkg/README.md": "# Package", "vendor/lib.md": "# Vendor lib"},
     )
 
     recent = service.get_recently_changed_files(limit=30)
@@ -261,7 +351,8 @@ def test_recently_changed_includes_intent_to_add_files(git_repo):
         ["git", "add", "-N", "intent.md"],
         cwd=git_repo,
         check=True,
-        capture_output=True,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
     )
 
     recent = service.get_recently_changed_files(limit=30)
@@ -284,7 +375,8 @@ def test_intent_to_add_detected_by_find_method(git_repo):
         ["git", "add", "-N", "ita_file.md"],
         cwd=git_repo,
         check=True,
-        capture_output=True,
+        stdout=DEVNULL,
+        stderr=DEVNULL,
     )
 
     ita_files = service._find_intent_to_add_files()
@@ -298,12 +390,7 @@ def test_intent_to_add_not_confused_with_normal_add(git_repo):
 
     # Create and stage normally (full add, not -N)
     (git_repo / "normal_add.md").write_text("# Normal add\n")
-    subprocess.run(
-        ["git", "add", "normal_add.md"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-    )
+    _stage(git_repo, "normal_add.md")
 
     ita_files = service._find_intent_to_add_files()
     resolved = str((git_repo / "normal_add.md").resolve())
@@ -313,37 +400,19 @@ def test_intent_to_add_not_confused_with_normal_add(git_repo):
 def test_recently_changed_files_sorted_by_date(git_repo):
     """Test that recent files are strictly sorted by date descending,
     regardless of whether they are tracked or untracked."""
-    import time
-
     service = GitService(git_repo)
 
     # Create a tracked file with an old commit
-    (git_repo / "old_tracked.md").write_text("# Old tracked\n")
-    subprocess.run(["git", "add", "."], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Add old tracked"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-    )
+    _make_commit(git_repo, "Add old tracked", {"old_tracked.md": "# Old tracked\n"})
 
     # Create an untracked file with an older mtime
     (git_repo / "old_untracked.md").write_text("# Old untracked\n")
     old_time = time.time() - 86400 * 30  # 30 days ago
-    import os
-
     os.utime(git_repo / "old_untracked.md", (old_time, old_time))
 
-    # Now modify a tracked file so it has a very recent mtime
-    time.sleep(1)
-    (git_repo / "README.md").write_text("# Freshly edited\n")
-    subprocess.run(["git", "add", "."], cwd=git_repo, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "commit", "-m", "Fresh edit"],
-        cwd=git_repo,
-        check=True,
-        capture_output=True,
-    )
+    # Now modify a tracked file with a commit pinned after the others
+    fresh_time = int(time.time()) + 60
+    _make_commit(git_repo, "Fresh edit", {"README.md": "# Freshly edited\n"}, when=fresh_time)
 
     recent = service.get_recently_changed_files(limit=30)
     dates = [f["date"] for f in recent]
@@ -363,6 +432,7 @@ def test_recently_changed_files_sorted_by_date(git_repo):
     )
 
 
+@pytest.mark.xdist_group("untracked_lifecycle")
 class TestUntrackedLifecycle:
     """Full lifecycle tests: no file → untracked → staged → committed.
 
@@ -370,64 +440,9 @@ class TestUntrackedLifecycle:
     """
 
     @staticmethod
-    def _clear_recent_cache():
-        """Flush the module-level recent-files cache so the next call is fresh."""
-        from vantage.services.git_service import _recent_files_cache
-
-        _recent_files_cache.clear()
-
-    @staticmethod
-    def _find(results, path):
-        """Find a result entry by path, or None."""
-        return next((r for r in results if r["path"] == path), None)
-
-    def test_new_file_is_untracked(self, git_repo):
-        """A brand-new file that has never been added or committed is untracked."""
-        service = GitService(git_repo)
-        (git_repo / "new_file.md").write_text("# New\n")
-        self._clear_recent_cache()
-        results = service.get_recently_changed_files(limit=30)
-        entry = self._find(results, "new_file.md")
-        assert entry is not None, "new_file.md not found in results"
-        assert entry["untracked"] is True
-
-    def test_staged_file_still_untracked_or_ita(self, git_repo):
-        """After 'git add' (but no commit), the file is either ITA or untracked."""
-        service = GitService(git_repo)
-        (git_repo / "staged.md").write_text("# Staged\n")
-        subprocess.run(["git", "add", "staged.md"], cwd=git_repo, check=True, capture_output=True)
-        self._clear_recent_cache()
-        results = service.get_recently_changed_files(limit=30)
-        entry = self._find(results, "staged.md")
-        assert entry is not None, "staged.md not found in results"
-        # Before commit, file has no log history so it should be untracked/ITA
-        assert entry["untracked"] is True
-
-    def test_committed_file_is_tracked(self, git_repo):
-        """After commit, the file must have untracked=False."""
-        service = GitService(git_repo)
-        (git_repo / "committed.md").write_text("# Committed\n")
-        subprocess.run(
-            ["git", "add", "committed.md"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "Add committed.md"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        self._clear_recent_cache()
-        results = service.get_recently_changed_files(limit=30)
-        entry = self._find(results, "committed.md")
-        assert entry is not None, "committed.md not found in results"
-        assert entry["untracked"] is False, (
-            f"committed.md still marked untracked after commit: {entry}"
-        )
-        assert entry["message"] == "Add committed.md"
-        assert entry["author_name"] == "Test User"
+    def _by_path(results):
+        """Index result entries by path."""
+        return {r["path"]: r for r in results}
 
     def test_full_lifecycle_untracked_to_committed(self, git_repo):
         """Full lifecycle: create → untracked, add → untracked, commit → tracked."""
@@ -435,38 +450,28 @@ class TestUntrackedLifecycle:
 
         # Phase 1: create file (untracked)
         (git_repo / "lifecycle.md").write_text("# Phase 1\n")
-        self._clear_recent_cache()
-        r1 = service.get_recently_changed_files(limit=30)
-        e1 = self._find(r1, "lifecycle.md")
+        r1 = self._by_path(service.get_recently_changed_files(limit=30))
+        e1 = r1.get("lifecycle.md")
         assert e1 is not None, "Phase 1: lifecycle.md not in results"
         assert e1["untracked"] is True, f"Phase 1: expected untracked=True, got {e1}"
 
         # Phase 2: git add (still no commit history → untracked)
-        subprocess.run(
-            ["git", "add", "lifecycle.md"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        self._clear_recent_cache()
-        r2 = service.get_recently_changed_files(limit=30)
-        e2 = self._find(r2, "lifecycle.md")
+        _stage(git_repo, "lifecycle.md")
+        clear_recent_files_cache()
+        r2 = self._by_path(service.get_recently_changed_files(limit=30))
+        e2 = r2.get("lifecycle.md")
         assert e2 is not None, "Phase 2: lifecycle.md not in results"
         assert e2["untracked"] is True, f"Phase 2: expected untracked=True, got {e2}"
 
         # Phase 3: git commit → must transition to tracked
-        subprocess.run(
-            ["git", "commit", "-m", "commit lifecycle.md"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        self._clear_recent_cache()
-        r3 = service.get_recently_changed_files(limit=30)
-        e3 = self._find(r3, "lifecycle.md")
+        _make_commit(git_repo, "commit lifecycle.md")
+        clear_recent_files_cache()
+        r3 = self._by_path(service.get_recently_changed_files(limit=30))
+        e3 = r3.get("lifecycle.md")
         assert e3 is not None, "Phase 3: lifecycle.md not in results"
         assert e3["untracked"] is False, f"Phase 3: lifecycle.md still untracked after commit: {e3}"
         assert e3["message"] == "commit lifecycle.md"
+        assert e3["author_name"] == "Test User"
 
     def test_nested_file_lifecycle(self, git_repo):
         """Same lifecycle but for a file in a subdirectory."""
@@ -476,28 +481,16 @@ class TestUntrackedLifecycle:
 
         # Phase 1: untracked
         (subdir / "deep.md").write_text("# Deep\n")
-        self._clear_recent_cache()
-        r1 = service.get_recently_changed_files(limit=30)
-        e1 = self._find(r1, "notes/deep.md")
+        r1 = self._by_path(service.get_recently_changed_files(limit=30))
+        e1 = r1.get("notes/deep.md")
         assert e1 is not None, "Phase 1: notes/deep.md not in results"
         assert e1["untracked"] is True
 
         # Phase 2: commit → tracked
-        subprocess.run(
-            ["git", "add", "notes/deep.md"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        subprocess.run(
-            ["git", "commit", "-m", "add deep note"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
-        self._clear_recent_cache()
-        r2 = service.get_recently_changed_files(limit=30)
-        e2 = self._find(r2, "notes/deep.md")
+        _make_commit(git_repo, "add deep note", {"notes/deep.md": "# Deep\n"})
+        clear_recent_files_cache()
+        r2 = self._by_path(service.get_recently_changed_files(limit=30))
+        e2 = r2.get("notes/deep.md")
         assert e2 is not None, "Phase 2: notes/deep.md not in results"
         assert e2["untracked"] is False, (
             f"Phase 2: notes/deep.md still untracked after commit: {e2}"
@@ -513,25 +506,20 @@ class TestUntrackedLifecycle:
         (subdir / "c.md").write_text("# C\n")
 
         # All start untracked
-        self._clear_recent_cache()
-        r1 = service.get_recently_changed_files(limit=30)
+        r1 = self._by_path(service.get_recently_changed_files(limit=30))
         for name in ["a.md", "b.md", "sub/c.md"]:
-            e = self._find(r1, name)
+            e = r1.get(name)
             assert e is not None, f"{name} not found before commit"
             assert e["untracked"] is True, f"{name} should be untracked before commit"
 
         # Commit all at once
-        subprocess.run(["git", "add", "-A"], cwd=git_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "batch commit"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
+        _make_commit(
+            git_repo, "batch commit", {"a.md": "# A\n", "b.md": "# B\n", "sub/c.md": "# C\n"}
         )
-        self._clear_recent_cache()
-        r2 = service.get_recently_changed_files(limit=30)
+        clear_recent_files_cache()
+        r2 = self._by_path(service.get_recently_changed_files(limit=30))
         for name in ["a.md", "b.md", "sub/c.md"]:
-            e = self._find(r2, name)
+            e = r2.get(name)
             assert e is not None, f"{name} not found after commit"
             assert e["untracked"] is False, f"{name} still untracked after commit: {e}"
 
@@ -541,151 +529,108 @@ class TestUntrackedLifecycle:
         (git_repo / "cached.md").write_text("# Cached\n")
 
         # Prime the cache with untracked result
-        results1 = service.get_recently_changed_files(limit=30)
-        e1 = self._find(results1, "cached.md")
+        results1 = self._by_path(service.get_recently_changed_files(limit=30))
+        e1 = results1.get("cached.md")
         assert e1 is not None
         assert e1["untracked"] is True
 
         # Commit the file
-        subprocess.run(["git", "add", "cached.md"], cwd=git_repo, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "commit cached.md"],
-            cwd=git_repo,
-            check=True,
-            capture_output=True,
-        )
+        _make_commit(git_repo, "commit cached.md", {"cached.md": "# Cached\n"})
 
         # Without clearing cache, within TTL, might still be stale
         # (this is expected behavior — TTL cache)
 
         # After clearing cache, must return fresh data
-        self._clear_recent_cache()
-        results2 = service.get_recently_changed_files(limit=30)
-        e2 = self._find(results2, "cached.md")
+        clear_recent_files_cache()
+        results2 = self._by_path(service.get_recently_changed_files(limit=30))
+        e2 = results2.get("cached.md")
         assert e2 is not None
         assert e2["untracked"] is False, (
             f"cached.md still untracked after cache clear + commit: {e2}"
         )
 
 
-class TestWatcherFilter:
-    """Tests for the custom watcher filter that allows git state files through."""
-
-    def test_allows_md_files(self):
-        from watchfiles import Change
-
-        from vantage.services.watcher import _GitAwareFilter
-
-        f = _GitAwareFilter()
-        assert f(Change.modified, "/repo/docs/readme.md") is True
-        assert f(Change.added, "/repo/notes.md") is True
-
-    def test_blocks_git_objects(self):
-        from watchfiles import Change
-
-        from vantage.services.watcher import _GitAwareFilter
+@pytest.fixture(scope="class")
+def gitfilter():
+    """One shared _GitAwareFilter; it holds no per-call state."""
+    from vantage.services.watcher import _GitAwareFilter
 
-        f = _GitAwareFilter()
-        assert f(Change.modified, "/repo/.git/objects/ab/cdef1234") is False
-        assert f(Change.modified, "/repo/.git/refs/heads/main") is False
-        assert f(Change.modified, "/repo/.git/logs/HEAD") is False
+    return _GitAwareFilter()
 
-    def test_allows_git_state_files(self):
-        from watchfiles import Change
-
-        from vantage.services.watcher import _GitAwareFilter
-
-        f = _GitAwareFilter()
-        assert f(Change.modified, "/repo/.git/index") is True
-        assert f(Change.modified, "/repo/.git/HEAD") is True
-        assert f(Change.modified, "/repo/.git/MERGE_HEAD") is True
-        assert f(Change.modified, "/repo/.git/REBASE_HEAD") is True
-        assert f(Change.modified, "/repo/.git/CHERRY_PICK_HEAD") is True
-
-    def test_blocks_nested_git_state_files(self):
-        """State file names in subdirectories of .git should be blocked."""
-        from watchfiles import Change
-
-        from vantage.services.watcher import _GitAwareFilter
-
-        f = _GitAwareFilter()
-        assert f(Change.modified, "/repo/.git/refs/HEAD") is False
-        assert f(Change.modified, "/repo/.git/subdir/index") is False
-
-    def test_still_filters_common_dirs(self):
-        """node_modules, __pycache__, etc. should still be filtered."""
-        from watchfiles import Change
-
-        from vantage.services.watcher import _GitAwareFilter
-
-        f = _GitAwareFilter()
-        assert f(Change.modified, "/repo/node_modules/foo/bar.md") is False
-        assert f(Change.modified, "/repo/__pycache__/foo.pyc") is False
 
+@pytest.mark.xdist_group("watcher_filter")
+class TestWatcherFilter:
+    """Tests for the custom watcher filter that allows git state files through."""
 
-def _init_git_repo(path):
-    """Helper: git init + configure user + initial commit at path."""
-    subprocess.run(["git", "init"], cwd=path, check=True, capture_output=True)
-    subprocess.run(
-        ["git", "config", "user.email", "test@example.com"],
-        cwd=path,
-        check=True,
-        capture_output=True,
-    )
-    subprocess.run(
-        ["git", "config", "user.name", "Test User"],
-        cwd=path,
-        check=True,
-        capture_output=True,
+    @pytest.mark.parametrize(
+        ("path", "expected"),
+        [
+            ("/repo/docs/readme.md", True),
+            ("/repo/notes.md", True),
+            ("/repo/.git/objects/ab/cdef1234", False),
+            ("/repo/.git/refs/heads/main", False),
+            ("/repo/.git/logs/HEAD", False),
+            ("/repo/.git/index", True),
+            ("/repo/.git/HEAD", True),
+            ("/repo/.git/MERGE_HEAD", True),
+            ("/repo/.git/REBASE_HEAD", True),
+            ("/repo/.git/CHERRY_PICK_HEAD", True),
+            ("/repo/.git/refs/HEAD", False),
+            ("/repo/.git/subdir/index", False),
+            ("/repo/node_modules/foo/bar.md", False),
+            ("/repo/__pycache__/foo.pyc", False),
+        ],
     )
+    def test_git_aware_filter(self, gitfilter, path, expected):
+        """md files and top-level .git state files pass; other .git/ + common dirs don't."""
+        assert gitfilter(Change.modified, path) is expected
+
+
+def _build_repo(path, files, message):
+    """Helper: init a repo at path, write *files* and make one root commit."""
+    _make_commit(_init_repo(path), message, files)
+    return path
+
+
+@pytest.fixture(scope="session")
+def _child_repo_templates(tmp_path_factory):
+    """Build the two independent child repos concurrently; returns (a, b)."""
+    tpl = tmp_path_factory.mktemp("tpl")
+    # Child repo A: project_a with committed files
+    repo_a = tpl / "project_a"
+    files_a = {"README.md": "# Project A\n", "notes.md": "# Notes\n"}
+    # Child repo B: project_b with committed + untracked files
+    repo_b = tpl / "project_b"
+    files_b = {"guide.md": "# Guide\n"}
+
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        list(
+            ex.map(
+                lambda args: _build_repo(*args),
+                [(repo_a, files_a, "Initial A"), (repo_b, files_b, "Initial B")],
+            )
+        )
+    (repo_b / "draft.md").write_text("# Draft\n")  # untracked
+    return repo_a, repo_b
 
 
+@pytest.mark.xdist_group("multi_git_repos")
 class TestMultiGitRepos:
     """Tests for a parent directory containing multiple child git repos."""
 
     @staticmethod
-    def _clear_cache():
-        from vantage.services.git_service import _recent_files_cache
-
-        _recent_files_cache.clear()
+    def _by_path(results):
+        """Index result entries by path."""
+        return {r["path"]: r for r in results}
 
     @staticmethod
-    def _find(results, path):
-        return next((r for r in results if r["path"] == path), None)
-
-    @pytest.fixture
-    def parent_with_child_repos(self, tmp_path):
-        """Create ~/projects-like structure with 2 child git repos."""
-        parent = tmp_path / "projects"
-        parent.mkdir()
+    def _populate_parent(parent, child_templates):
+        """Lay out ~/projects-like structure with the child repos under *parent*."""
+        parent.mkdir(parents=True)
 
-        # Child repo A: project_a with committed files
-        repo_a = parent / "project_a"
-        repo_a.mkdir()
-        _init_git_repo(repo_a)
-        (repo_a / "README.md").write_text("# Project A\n")
-        (repo_a / "notes.md").write_text("# Notes\n")
-        subprocess.run(["git", "add", "."], cwd=repo_a, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial A"],
-            cwd=repo_a,
-            check=True,
-            capture_output=True,
-        )
-
-        # Child repo B: project_b with committed + untracked files
-        repo_b = parent / "project_b"
-        repo_b.mkdir()
-        _init_git_repo(repo_b)
-        (repo_b / "guide.md").write_text("# Guide\n")
-        subprocess.run(["git", "add", "."], cwd=repo_b, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial B"],
-            cwd=repo_b,
-            check=True,
-            capture_output=True,
-        )
-        (repo_b / "draft.md").write_text("# Draft\n")  # untracked
+        # Child repos are copied from session-scoped templates
+        for template in child_templates:
+            shutil.copytree(template, parent / template.name, symlinks=True)
 
         # Top-level file (no git repo)
         (parent / "TODO.md").write_text("# TODO\n")
@@ -697,9 +642,30 @@ class TestMultiGitRepos:
 
         return parent
 
-    def test_discovers_child_repos(self, parent_with_child_repos):
+    @pytest.fixture
+    def parent_with_child_repos(self, git_base, request, _child_repo_templates):
+        """Create ~/projects-like structure with 2 child git repos."""
+        return self._populate_parent(
+            git_base / request.node.name / "projects", _child_repo_templates
+        )
+
+    @pytest.fixture(scope="class")
+    @classmethod
+    def recent_by_path(cls, tmp_path_factory, _child_repo_templates):
+        """Recent files of one untouched multi-repo tree, shared by read-only tests."""
+        parent = cls._populate_parent(
+            tmp_path_factory.mktemp("shared") / "projects", _child_repo_templates
+        )
+        clear_recent_files_cache()
+        return cls._by_path(GitService(parent).get_recently_changed_files(limit=30))
+
+    @pytest.fixture
+    def service(self, parent_with_child_repos):
+        """GitService rooted at the multi-repo parent directory."""
+        return GitService(parent_with_child_repos)
+
+    def test_discovers_child_repos(self, service):
         """GitService on parent dir discovers child git repos."""
-        service = GitService(parent_with_child_repos)
         assert service.repo is None  # parent is NOT a git repo
         children = service._discover_child_git_repos()
         names = {c.name for c in children}
@@ -707,58 +673,27 @@ class TestMultiGitRepos:
         assert "project_b" in names
         assert "misc" not in names  # no .git
 
-    def test_committed_files_show_tracked(self, parent_with_child_repos):
-        """Committed files in child repos show as tracked (not untracked)."""
-        self._clear_cache()
-        service = GitService(parent_with_child_repos)
-        results = service.get_recently_changed_files(limit=30)
-
-        # project_a/README.md should be tracked
-        entry = self._find(results, "project_a/README.md")
-        assert entry is not None, "project_a/README.md not found"
-        assert entry["untracked"] is False
-        assert entry["message"] == "Initial A"
-        assert entry["author_name"] == "Test User"
-
-        # project_b/guide.md should be tracked
-        entry = self._find(results, "project_b/guide.md")
-        assert entry is not None, "project_b/guide.md not found"
-        assert entry["untracked"] is False
-
-    def test_untracked_files_in_child_repo(self, parent_with_child_repos):
-        """Untracked files in child repos show as untracked."""
-        self._clear_cache()
-        service = GitService(parent_with_child_repos)
-        results = service.get_recently_changed_files(limit=30)
-
-        entry = self._find(results, "project_b/draft.md")
-        assert entry is not None, "project_b/draft.md not found"
-        assert entry["untracked"] is True
-
-    def test_top_level_files_are_untracked(self, parent_with_child_repos):
-        """Files at the parent level (no git) are untracked."""
-        self._clear_cache()
-        service = GitService(parent_with_child_repos)
-        results = service.get_recently_changed_files(limit=30)
-
-        entry = self._find(results, "TODO.md")
-        assert entry is not None, "TODO.md not found"
-        assert entry["untracked"] is True
-
-    def test_non_git_subdir_files_are_untracked(self, parent_with_child_repos):
-        """Files in non-git subdirectories show as untracked."""
-        self._clear_cache()
-        service = GitService(parent_with_child_repos)
-        results = service.get_recently_changed_files(limit=30)
-
-        entry = self._find(results, "misc/scratch.md")
-        assert entry is not None, "misc/scratch.md not found"
-        assert entry["untracked"] is True
-
-    def test_all_files_present(self, parent_with_child_repos):
+    @pytest.mark.parametrize(
+        ("path", "untracked", "message"),
+        [
+            ("project_a/README.md", False, "Initial A"),
+            ("project_b/guide.md", False, "Initial B"),
+            ("project_b/draft.md", True, None),  # untracked inside a child repo
+            ("TODO.md", True, None),  # top level, no git
+            ("misc/scratch.md", True, None),  # non-git subdirectory
+        ],
+    )
+    def test_entry_status(self, recent_by_path, path, untracked, message):
+        """Committed child-repo files are tracked; everything else is untracked."""
+        entry = recent_by_path.get(path)
+        assert entry is not None, f"{path} not found"
+        assert entry["untracked"] is untracked
+        if message is not None:
+            assert entry["message"] == message
+            assert entry["author_name"] == "Test User"
+
+    def test_all_files_present(self, service):
         """All .md files across child repos and loose dirs appear in results."""
-        self._clear_cache()
-        service = GitService(parent_with_child_repos)
         results = service.get_recently_changed_files(limit=30)
         paths = {r["path"] for r in results}
 
@@ -772,10 +707,8 @@ class TestMultiGitRepos:
         }
         assert expected.issubset(paths), f"Missing: {expected - paths}"
 
-    def test_results_sorted_by_date(self, parent_with_child_repos):
+    def test_results_sorted_by_date(self, service):
         """Results from all sources are sorted by date descending."""
-        self._clear_cache()
-        service = GitService(parent_with_child_repos)
         results = service.get_recently_changed_files(limit=30)
         dates = [r["date"] for r in results]
         for i in range(len(dates) - 1):
@@ -790,7 +723,6 @@ class TestMultiGitRepos:
         subdir.mkdir()
         (subdir / "notes.md").write_text("# Notes\n")
 
-        self._clear_cache()
         service = GitService(parent)
         results = service.get_recently_changed_files(limit=30)
 
@@ -798,9 +730,8 @@ class TestMultiGitRepos:
         for r in results:
             assert r["untracked"] is True
 
-    def test_get_history_delegates_to_child_repo(self, parent_with_child_repos):
+    def test_get_history_delegates_to_child_repo(self, service):
         """get_history returns commit history for files in child git repos."""
-        service = GitService(parent_with_child_repos)
         assert service.repo is None  # parent is NOT a git repo
 
         history = service.get_history("project_a/README.md", limit=10)
@@ -809,39 +740,28 @@ class TestMultiGitRepos:
         assert history[0].author_name == "Test User"
         assert history[0].hexsha  # has a real SHA
 
-    def test_get_history_returns_empty_for_top_level_file(self, parent_with_child_repos):
+    def test_get_history_returns_empty_for_top_level_file(self, service):
         """get_history returns empty for files not in any child git repo."""
-        service = GitService(parent_with_child_repos)
         history = service.get_history("TODO.md", limit=10)
         assert history == []
 
-    def test_get_last_commit_delegates_to_child_repo(self, parent_with_child_repos):
+    def test_get_last_commit_delegates_to_child_repo(self, service):
         """get_last_commit returns the latest commit for a child repo file."""
-        service = GitService(parent_with_child_repos)
         commit = service.get_last_commit("project_b/guide.md")
         assert commit is not None
         assert commit.message == "Initial B"
 
-    def test_get_last_commit_returns_none_for_untracked(self, parent_with_child_repos):
+    def test_get_last_commit_returns_none_for_untracked(self, service):
         """get_last_commit returns None for untracked files in child repos."""
-        service = GitService(parent_with_child_repos)
         commit = service.get_last_commit("project_b/draft.md")
         assert commit is None
 
-    def test_get_file_diff_delegates_to_child_repo(self, parent_with_child_repos):
+    def test_get_file_diff_delegates_to_child_repo(self, parent_with_child_repos, service):
         """get_file_diff works for files in child git repos."""
         # Add a second commit so we can diff against the parent
         repo_a = parent_with_child_repos / "project_a"
-        (repo_a / "README.md").write_text("# Project A\nUpdated content\n")
-        subprocess.run(["git", "add", "."], cwd=repo_a, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Update README"],
-            cwd=repo_a,
-            check=True,
-            capture_output=True,
-        )
+        _make_commit(repo_a, "Update README", {"README.md": "# Project A\nUpdated content\n"})
 
-        service = GitService(parent_with_child_repos)
         commit = service.get_last_commit("project_a/README.md")
         assert commit is not None
         assert commit.message == "Update README"
@@ -850,9 +770,8 @@ class TestMultiGitRepos:
         assert diff is not None
         assert diff.commit_hexsha == commit.hexsha
 
-    def test_get_last_commits_batch_delegates_to_child_repos(self, parent_with_child_repos):
+    def test_get_last_commits_batch_delegates_to_child_repos(self, service):
         """get_last_commits_batch returns commits for files across child repos."""
-        service = GitService(parent_with_child_repos)
         paths = [
             "project_a/README.md",
             "project_b/guide.md",
@@ -1,5 +1,6 @@
 """Security tests for path traversal, repo isolation, and input validation."""
 
+from contextlib import contextmanager
 from pathlib import Path
 
 import pytest
@@ -7,8 +8,47 @@ from fastapi.testclient import TestClient
 
 from vantage.main import app
 from vantage.services.fs_service import FileSystemService
+from vantage.settings import get_daemon_config
 
-client = TestClient(app)
+
+@pytest.fixture(scope="module")
+def client():
+    """One TestClient for the module; settings are flipped per test."""
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def empty_repo(tmp_path_factory):
+    """Shared empty single-repo root for tests that never touch the filesystem."""
+    return tmp_path_factory.mktemp("empty_repo")
+
+
+@pytest.fixture
+def use_daemon_config():
+    """Return ``use(config)``, which serves *config* as the app's daemon config.
+
+    Goes through ``app.dependency_overrides`` rather than the settings module,
+    and every override is dropped at teardown.
+    """
+
+    def _use(config):
+        app.dependency_overrides[get_daemon_config] = lambda: config
+
+    yield _use
+    app.dependency_overrides.clear()
+
+
+@contextmanager
+def set_repo(path):
+    """Point single-repo mode at *path* for the duration of the block."""
+    from vantage.settings import settings
+
+    saved = settings.target_repo
+    settings.target_repo = path
+    try:
+        yield
+    finally:
+        settings.target_repo = saved
 
 
 # ---------------------------------------------------------------------------
@@ -132,37 +172,25 @@ class TestListDirectoryFiltering:
 class TestApiPathTraversal:
     """Ensure API endpoints reject path traversal."""
 
-    def test_tree_path_traversal(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-
-        response = client.get("/api/tree?path=../../etc")
-        assert response.status_code == 400
-
-    def test_content_path_traversal(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-
-        response = client.get("/api/content?path=../../etc/passwd")
-        assert response.status_code == 400
-
-    def test_content_absolute_path(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
+    def test_tree_path_traversal(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/tree?path=../../etc")
+            assert response.status_code == 400
 
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
+    def test_content_path_traversal(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/content?path=../../etc/passwd")
+            assert response.status_code == 400
 
-        response = client.get("/api/content?path=/etc/passwd")
-        assert response.status_code == 400
+    def test_content_absolute_path(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/content?path=/etc/passwd")
+            assert response.status_code == 400
 
-    def test_content_null_byte(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-
-        response = client.get("/api/content?path=test.md%00.txt")
-        assert response.status_code == 400
+    def test_content_null_byte(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/content?path=test.md%00.txt")
+            assert response.status_code == 400
 
 
 # ---------------------------------------------------------------------------
@@ -174,9 +202,8 @@ class TestDaemonModeBlocking:
     """Legacy endpoints must return 404 when server is in multi-repo mode."""
 
     @pytest.fixture(autouse=True)
-    def _setup_daemon_mode(self, tmp_path, monkeypatch):
+    def _setup_daemon_mode(self, tmp_path, use_daemon_config):
         """Enable multi-repo mode for these tests."""
-        from vantage import settings as settings_mod
         from vantage.config import DaemonConfig, RepoConfig
 
         config = DaemonConfig(
@@ -185,64 +212,57 @@ class TestDaemonModeBlocking:
             ]
         )
 
-        # Set daemon config
-        monkeypatch.setattr(settings_mod, "daemon_config", config)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", True)
+        # Serve it as the daemon config
+        use_daemon_config(config)
 
         # Create test content
         (tmp_path / "hello.md").write_text("# Hello")
         self.tmp_path = tmp_path
 
-        yield
-
-        # Clean up
-        monkeypatch.setattr(settings_mod, "daemon_config", None)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", False)
-
-    def test_legacy_tree_blocked(self):
+    def test_legacy_tree_blocked(self, client):
         response = client.get("/api/tree")
         assert response.status_code == 404
 
-    def test_legacy_content_blocked(self):
+    def test_legacy_content_blocked(self, client):
         response = client.get("/api/content?path=hello.md")
         assert response.status_code == 404
 
-    def test_legacy_git_history_blocked(self):
+    def test_legacy_git_history_blocked(self, client):
         response = client.get("/api/git/history?path=hello.md")
         assert response.status_code == 404
 
-    def test_legacy_git_status_blocked(self):
+    def test_legacy_git_status_blocked(self, client):
         response = client.get("/api/git/status?path=hello.md")
         assert response.status_code == 404
 
-    def test_legacy_git_diff_blocked(self):
+    def test_legacy_git_diff_blocked(self, client):
         response = client.get("/api/git/diff?path=hello.md&commit=abc123")
         assert response.status_code in (400, 404)
 
-    def test_legacy_git_recent_blocked(self):
+    def test_legacy_git_recent_blocked(self, client):
         response = client.get("/api/git/recent")
         assert response.status_code == 404
 
-    def test_legacy_info_blocked(self):
+    def test_legacy_info_blocked(self, client):
         response = client.get("/api/info")
         assert response.status_code == 404
 
-    def test_legacy_files_blocked(self):
+    def test_legacy_files_blocked(self, client):
         response = client.get("/api/files")
         assert response.status_code == 404
 
-    def test_multirepo_tree_works(self):
+    def test_multirepo_tree_works(self, client):
         response = client.get("/api/r/testrepo/tree")
         assert response.status_code == 200
         names = [n["name"] for n in response.json()]
         assert "hello.md" in names
 
-    def test_multirepo_content_works(self):
+    def test_multirepo_content_works(self, client):
         response = client.get("/api/r/testrepo/content?path=hello.md")
         assert response.status_code == 200
         assert response.json()["content"] == "# Hello"
 
-    def test_multirepo_invalid_repo_rejected(self):
+    def test_multirepo_invalid_repo_rejected(self, client):
         response = client.get("/api/r/nonexistent/tree")
         assert response.status_code == 404
 
@@ -255,20 +275,16 @@ class TestDaemonModeBlocking:
 class TestRepoInfoNoPathLeak:
     """Ensure /api/repos does not expose absolute filesystem paths."""
 
-    def test_single_repo_no_path(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-
-        response = client.get("/api/repos")
-        assert response.status_code == 200
-        data = response.json()
-        assert len(data) == 1
-        assert "path" not in data[0]
-        assert data[0]["name"] == ""
+    def test_single_repo_no_path(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/repos")
+            assert response.status_code == 200
+            data = response.json()
+            assert len(data) == 1
+            assert "path" not in data[0]
+            assert data[0]["name"] == ""
 
-    def test_multi_repo_no_path(self, tmp_path, monkeypatch):
-        from vantage import settings as settings_mod
+    def test_multi_repo_no_path(self, client, tmp_path, use_daemon_config):
         from vantage.config import DaemonConfig, RepoConfig
 
         config = DaemonConfig(
@@ -276,19 +292,14 @@ class TestRepoInfoNoPathLeak:
                 RepoConfig(name="notes", path=tmp_path),
             ]
         )
-        monkeypatch.setattr(settings_mod, "daemon_config", config)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", True)
+        use_daemon_config(config)
 
-        try:
-            response = client.get("/api/repos")
-            assert response.status_code == 200
-            data = response.json()
-            for repo in data:
-                assert "path" not in repo, f"Absolute path leaked: {repo}"
-                assert repo["name"] == "notes"
-        finally:
-            monkeypatch.setattr(settings_mod, "daemon_config", None)
-            monkeypatch.setattr(settings_mod.settings, "multi_repo", False)
+        response = client.get("/api/repos")
+        assert response.status_code == 200
+        data = response.json()
+        for repo in data:
+            assert "path" not in repo, f"Absolute path leaked: {repo}"
+            assert repo["name"] == "notes"
 
 
 # ---------------------------------------------------------------------------
@@ -299,49 +310,35 @@ class TestRepoInfoNoPathLeak:
 class TestCommitShaValidation:
     """Ensure commit SHA parameter is validated as a hex string."""
 
-    def test_valid_sha_accepted(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-        (tmp_path / "test.md").write_text("hello")
-
-        # Valid SHA but file won't have this commit — should 404
-        response = client.get("/api/git/diff?path=test.md&commit=abc123def0")
-        assert response.status_code in (200, 404)
-
-    def test_invalid_sha_rejected(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
+    def test_valid_sha_accepted(self, client, tmp_path):
+        with set_repo(tmp_path):
+            (tmp_path / "test.md").write_text("hello")
 
-        # Shell injection attempt
-        response = client.get("/api/git/diff?path=test.md&commit=abc;rm+-rf+/")
-        assert response.status_code == 400
-
-    def test_sha_with_spaces_rejected(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
+            # Valid SHA but file won't have this commit — should 404
+            response = client.get("/api/git/diff?path=test.md&commit=abc123def0")
+            assert response.status_code in (200, 404)
 
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
+    def test_invalid_sha_rejected(self, client, empty_repo):
+        with set_repo(empty_repo):
+            # Shell injection attempt
+            response = client.get("/api/git/diff?path=test.md&commit=abc;rm+-rf+/")
+            assert response.status_code == 400
 
-        response = client.get("/api/git/diff?path=test.md&commit=abc def")
-        assert response.status_code == 400
+    def test_sha_with_spaces_rejected(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/git/diff?path=test.md&commit=abc def")
+            assert response.status_code == 400
 
-    def test_sha_too_short_rejected(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
+    def test_sha_too_short_rejected(self, client, empty_repo):
+        with set_repo(empty_repo):
+            response = client.get("/api/git/diff?path=test.md&commit=ab")
+            assert response.status_code == 400
 
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-
-        response = client.get("/api/git/diff?path=test.md&commit=ab")
-        assert response.status_code == 400
-
-    def test_sha_with_dot_dot_rejected(self, tmp_path, monkeypatch):
+    def test_sha_with_dot_dot_rejected(self, client, empty_repo):
         """Reject git revision range syntax like HEAD..main."""
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-
-        response = client.get("/api/git/diff?path=test.md&commit=HEAD..main")
-        assert response.status_code == 400
+        with set_repo(empty_repo):
+            response = client.get("/api/git/diff?path=test.md&commit=HEAD..main")
+            assert response.status_code == 400
 
 
 # ---------------------------------------------------------------------------
@@ -353,8 +350,7 @@ class TestRepoIsolation:
     """Ensure multi-repo endpoints cannot access files outside their configured root."""
 
     @pytest.fixture(autouse=True)
-    def _setup_repos(self, tmp_path, monkeypatch):
-        from vantage import settings as settings_mod
+    def _setup_repos(self, tmp_path, use_daemon_config):
         from vantage.config import DaemonConfig, RepoConfig
 
         # Create two isolated repos
@@ -372,34 +368,28 @@ class TestRepoIsolation:
                 RepoConfig(name="beta", path=repo_b),
             ]
         )
-        monkeypatch.setattr(settings_mod, "daemon_config", config)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", True)
+        use_daemon_config(config)
         self.repo_a = repo_a
         self.repo_b = repo_b
 
-        yield
-
-        monkeypatch.setattr(settings_mod, "daemon_config", None)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", False)
-
-    def test_cannot_traverse_to_other_repo(self):
+    def test_cannot_traverse_to_other_repo(self, client):
         response = client.get("/api/r/alpha/content?path=../repo_b/public_b.md")
         assert response.status_code == 400
 
-    def test_cannot_access_parent_directory(self):
+    def test_cannot_access_parent_directory(self, client):
         response = client.get("/api/r/alpha/content?path=../../../etc/passwd")
         assert response.status_code == 400
 
-    def test_cannot_read_absolute_path_via_repo(self):
+    def test_cannot_read_absolute_path_via_repo(self, client):
         response = client.get("/api/r/alpha/content?path=/etc/passwd")
         assert response.status_code == 400
 
-    def test_can_read_own_files(self):
+    def test_can_read_own_files(self, client):
         response = client.get("/api/r/alpha/content?path=secret_a.md")
         assert response.status_code == 200
         assert response.json()["content"] == "Repo A secret"
 
-    def test_repo_b_cannot_read_repo_a(self):
+    def test_repo_b_cannot_read_repo_a(self, client):
         response = client.get("/api/r/beta/content?path=../repo_a/secret_a.md")
         assert response.status_code == 400
 
@@ -407,40 +397,42 @@ class TestRepoIsolation:
 class TestRepoAllowedReadRoots:
     """Ensure per-repo allowed_read_roots only permits configured symlink targets."""
 
-    @pytest.fixture(autouse=True)
-    def _setup_repo(self, tmp_path, monkeypatch):
-        from vantage import settings as settings_mod
-        from vantage.config import DaemonConfig, RepoConfig
-
-        repo = tmp_path / "repo"
+    @pytest.fixture(scope="class")
+    @classmethod
+    def symlink_repo(cls, tmp_path_factory):
+        """Build the repo/allowed/blocked symlink layout once for the class."""
+        base = tmp_path_factory.mktemp("symlink_repo")
+        repo = base / "repo"
         repo.mkdir()
-        allowed = tmp_path / "allowed"
+        allowed = base / "allowed"
         allowed.mkdir()
-        blocked = tmp_path / "blocked"
+        blocked = base / "blocked"
         blocked.mkdir()
 
         (allowed / "ok.md").write_text("ok")
         (blocked / "no.md").write_text("no")
         (repo / "ok.md").symlink_to(allowed / "ok.md")
         (repo / "no.md").symlink_to(blocked / "no.md")
+        return repo, allowed
+
+    @pytest.fixture(autouse=True)
+    def _setup_repo(self, symlink_repo, use_daemon_config):
+        from vantage.config import DaemonConfig, RepoConfig
 
+        repo, allowed = symlink_repo
         config = DaemonConfig(
             repos=[
                 RepoConfig(name="repo", path=repo, allowed_read_roots=[allowed]),
             ]
         )
-        monkeypatch.setattr(settings_mod, "daemon_config", config)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", True)
-        yield
-        monkeypatch.setattr(settings_mod, "daemon_config", None)
-        monkeypatch.setattr(settings_mod.settings, "multi_repo", False)
+        use_daemon_config(config)
 
-    def test_allows_symlink_target_inside_allowed_root(self):
+    def test_allows_symlink_target_inside_allowed_root(self, client):
         response = client.get("/api/r/repo/content?path=ok.md")
         assert response.status_code == 200
         assert response.json()["content"] == "ok"
 
-    def test_rejects_symlink_target_outside_allowed_root(self):
+    def test_rejects_symlink_target_outside_allowed_root(self, client):
         response = client.get("/api/r/repo/content?path=no.md")
         assert response.status_code == 400
 
@@ -453,7 +445,7 @@ class TestRepoAllowedReadRoots:
 class TestSecurityHeaders:
     """Verify security headers are set on all responses."""
 
-    def test_security_headers_present(self):
+    def test_security_headers_present(self, client):
         response = client.get("/api/info")
         assert response.headers["X-Content-Type-Options"] == "nosniff"
         assert response.headers["X-Frame-Options"] == "DENY"
@@ -468,22 +460,18 @@ class TestSecurityHeaders:
 class TestGitDirBlocking:
     """Ensure .git directory cannot be accessed via API."""
 
-    def test_content_git_config(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
-
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-        (tmp_path / ".git").mkdir()
-        (tmp_path / ".git" / "config").write_text("[core]")
-
-        response = client.get("/api/content?path=.git/config")
-        assert response.status_code == 400
+    def test_content_git_config(self, client, tmp_path):
+        with set_repo(tmp_path):
+            (tmp_path / ".git").mkdir()
+            (tmp_path / ".git" / "config").write_text("[core]")
 
-    def test_content_git_head(self, tmp_path, monkeypatch):
-        from vantage.settings import settings
+            response = client.get("/api/content?path=.git/config")
+            assert response.status_code == 400
 
-        monkeypatch.setattr(settings, "target_repo", tmp_path)
-        (tmp_path / ".git").mkdir()
-        (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main")
+    def test_content_git_head(self, client, tmp_path):
+        with set_repo(tmp_path):
+            (tmp_path / ".git").mkdir()
+            (tmp_path / ".git" / "HEAD").write_text("ref: refs/heads/main")
 
-        response = client.get("/api/content?path=.git/HEAD")
-        assert response.status_code == 400
+            response = client.get("/api/content?path=.git/HEAD")
+            assert response.status_code == 400
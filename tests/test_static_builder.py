@@ -1,48 +1,81 @@
 """Tests for the static site builder."""
 
+import functools
 import json
-import tempfile
+import tarfile
 from pathlib import Path
 
 import pytest
 
+from vantage.services import static_builder
 from vantage.services.static_builder import StaticSiteBuilder
 
 
+def _write_source(source: Path) -> Path:
+    """Populate *source* with the test markdown files."""
+    (source / "README.md").write_text("# Test README\n\nSome content.")
+    (source / "docs").mkdir()
+    (source / "docs" / "guide.md").write_text("# Guide\n\nA guide.")
+    return source
+
+
+def _write_frontend_dist(dist: Path) -> Path:
+    """Populate *dist* with mock frontend files."""
+    (dist / "index.html").write_text("<html><head></head><body>App</body></html>")
+    (dist / "assets").mkdir()
+    (dist / "assets" / "main.js").write_text("console.log('app');")
+    return dist
+
+
+@pytest.fixture(scope="session")
+def shared_source(tmp_path_factory):
+    """Read-only source tree shared by every test that only inspects output."""
+    return _write_source(tmp_path_factory.mktemp("source"))
+
+
+@pytest.fixture(scope="session")
+def shared_frontend_dist(tmp_path_factory):
+    """Read-only mock frontend dist shared across the session."""
+    return _write_frontend_dist(tmp_path_factory.mktemp("dist"))
+
+
+@pytest.fixture(scope="session")
+def build_site(tmp_path_factory, shared_source, shared_frontend_dist):
+    """Return ``build(repo_name=None) -> output``, building each repo_name only once.
+
+    The builder is deterministic for a given source, so tests that only read
+    the generated files share one build per repo_name instead of each paying
+    for a full ``build()``.
+    """
+
+    @functools.cache
+    def _build_once(repo_name: str | None = None) -> Path:
+        output = tmp_path_factory.mktemp("site")
+        StaticSiteBuilder(shared_source, output, shared_frontend_dist, repo_name=repo_name).build()
+        return output
+
+    return _build_once
+
+
 class TestStaticSiteBuilder:
     """Tests for the StaticSiteBuilder class."""
 
+    # Tests that need their own build run on pyfakefs's in-memory filesystem
+    # (the ``fs`` fixture), so their tree writes never touch the disk.
     @pytest.fixture
-    def temp_source(self):
-        """Create a temporary source directory with test files."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            source = Path(tmpdir)
-
-            # Create some test files
-            (source / "README.md").write_text("# Test README\n\nSome content.")
-            (source / "docs").mkdir()
-            (source / "docs" / "guide.md").write_text("# Guide\n\nA guide.")
-
-            yield source
+    def temp_source(self, fs):
+        """Create a source directory with test files."""
+        return _write_source(Path(fs.create_dir("/source").path))
 
     @pytest.fixture
-    def temp_output(self):
-        """Create a temporary output directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            yield Path(tmpdir)
+    def temp_output(self, fs):
+        """Create an output directory."""
+        return Path(fs.create_dir("/output").path)
 
     @pytest.fixture
-    def mock_frontend_dist(self):
+    def mock_frontend_dist(self, fs):
         """Create a mock frontend dist directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            dist = Path(tmpdir)
-
-            # Create mock frontend files
-            (dist / "index.html").write_text("<html><head></head><body>App</body></html>")
-            (dist / "assets").mkdir()
-            (dist / "assets" / "main.js").write_text("console.log('app');")
-
-            yield dist
+        return _write_frontend_dist(Path(fs.create_dir("/dist").path))
 
     def test_builder_creates_output_directory(self, temp_source, temp_output, mock_frontend_dist):
         """Test that the builder creates the output directory."""
@@ -53,21 +86,40 @@ class TestStaticSiteBuilder:
         assert output.exists()
         assert output.is_dir()
 
-    def test_builder_copies_frontend_files(self, temp_source, temp_output, mock_frontend_dist):
-        """Test that frontend files are copied."""
+    def test_builder_flushes_in_bounded_batches(
+        self, temp_source, temp_output, mock_frontend_dist, monkeypatch
+    ):
+        """Output is written as batches fill, not all held until the end."""
+        monkeypatch.setattr(static_builder, "_FLUSH_BATCH_BYTES", 1)
         builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
+        peak = 0
+        flush = builder._flush_writes
+
+        def _tracking_flush() -> None:
+            nonlocal peak
+            peak = max(peak, len(builder._pending_writes))
+            flush()
+
+        monkeypatch.setattr(builder, "_flush_writes", _tracking_flush)
         builder.build()
 
+        assert peak == 1
+        assert (temp_output / "api" / "content" / "docs" / "guide.md.json").exists()
         assert (temp_output / "index.html").exists()
-        assert (temp_output / "assets" / "main.js").exists()
 
-    def test_builder_generates_tree_data(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_copies_frontend_files(self, build_site):
+        """Test that frontend files are copied."""
+        output = build_site()
+
+        assert (output / "index.html").exists()
+        assert (output / "assets" / "main.js").exists()
+
+    def test_builder_generates_tree_data(self, build_site):
         """Test that tree JSON files are generated for all directories."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
         # Root tree
-        tree_file = temp_output / "api" / "tree" / "_.json"
+        tree_file = output / "api" / "tree" / "_.json"
         assert tree_file.exists()
 
         tree_data = json.loads(tree_file.read_text())
@@ -79,58 +131,52 @@ class TestStaticSiteBuilder:
         assert "docs" in names
 
         # Subdirectory tree
-        docs_tree = temp_output / "api" / "tree" / "docs.json"
+        docs_tree = output / "api" / "tree" / "docs.json"
         assert docs_tree.exists()
 
         docs_data = json.loads(docs_tree.read_text())
         doc_names = [item["name"] for item in docs_data]
         assert "guide.md" in doc_names
 
-    def test_builder_generates_content_files(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_content_files(self, build_site):
         """Test that content JSON files are generated for markdown files."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
         # Check README.md content file
-        readme_content = temp_output / "api" / "content" / "README.md.json"
+        readme_content = output / "api" / "content" / "README.md.json"
         assert readme_content.exists()
 
         content_data = json.loads(readme_content.read_text())
         assert "content" in content_data
         assert "Test README" in content_data["content"]
 
-    def test_builder_generates_subdirectory_content(
-        self, temp_source, temp_output, mock_frontend_dist
-    ):
+    def test_builder_generates_subdirectory_content(self, build_site):
         """Test that content files are generated for nested directories."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
         # Check docs/guide.md content file (proper path structure)
-        guide_content = temp_output / "api" / "content" / "docs" / "guide.md.json"
+        guide_content = output / "api" / "content" / "docs" / "guide.md.json"
         assert guide_content.exists()
 
         content_data = json.loads(guide_content.read_text())
         assert "Guide" in content_data["content"]
 
-    def test_builder_generates_static_sentinel(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_static_sentinel(self, build_site):
         """Test that the static mode sentinel file is generated."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
-        static_file = temp_output / "api" / "static.json"
+        static_file = output / "api" / "static.json"
         assert static_file.exists()
 
         data = json.loads(static_file.read_text())
         assert data["static"] is True
         assert data["generated_by"] == "vantage-static-builder"
 
-    def test_builder_generates_repos_json(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_repos_json(self, build_site):
         """Test that repos.json is generated for single-repo mode."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
-        repos_file = temp_output / "api" / "repos.json"
+        repos_file = output / "api" / "repos.json"
         assert repos_file.exists()
 
         data = json.loads(repos_file.read_text())
@@ -138,12 +184,11 @@ class TestStaticSiteBuilder:
         assert len(data) == 1
         assert data[0]["name"] == ""
 
-    def test_builder_generates_files_list(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_files_list(self, build_site):
         """Test that files.json contains all markdown files."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
-        files_file = temp_output / "api" / "files.json"
+        files_file = output / "api" / "files.json"
         assert files_file.exists()
 
         data = json.loads(files_file.read_text())
@@ -151,70 +196,79 @@ class TestStaticSiteBuilder:
         assert "README.md" in data
         assert "docs/guide.md" in data
 
-    def test_builder_generates_info_json(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_info_json(self, build_site):
         """Test that info.json contains the repo name."""
-        builder = StaticSiteBuilder(
-            temp_source, temp_output, mock_frontend_dist, repo_name="test-repo"
-        )
-        builder.build()
+        output = build_site("test-repo")
 
-        info_file = temp_output / "api" / "info.json"
+        info_file = output / "api" / "info.json"
         assert info_file.exists()
 
         data = json.loads(info_file.read_text())
         assert data["name"] == "test-repo"
 
-    def test_builder_generates_git_history(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_git_history(self, build_site):
         """Test that git history files are generated (empty for non-git dirs)."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
         # History file should exist even if empty (no git repo)
-        history_file = temp_output / "api" / "git" / "history" / "README.md.json"
+        history_file = output / "api" / "git" / "history" / "README.md.json"
         assert history_file.exists()
 
         data = json.loads(history_file.read_text())
         assert isinstance(data, list)
 
-    def test_builder_generates_recent_files(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_recent_files(self, build_site):
         """Test that recent files JSON is generated."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
-        recent_file = temp_output / "api" / "git" / "recent.json"
+        recent_file = output / "api" / "git" / "recent.json"
         assert recent_file.exists()
 
         data = json.loads(recent_file.read_text())
         assert isinstance(data, list)
 
-    def test_builder_injects_static_mode(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_injects_static_mode(self, build_site):
         """Test that static mode flag is injected into index.html."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
-        content = (temp_output / "index.html").read_text()
+        content = (output / "index.html").read_text()
         assert "window.__VANTAGE_STATIC__=true" in content
 
-    def test_builder_generates_spa_config(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_generates_spa_config(self, build_site):
         """Test that Cloudflare Pages config files are generated."""
-        builder = StaticSiteBuilder(temp_source, temp_output, mock_frontend_dist)
-        builder.build()
+        output = build_site()
 
-        assert (temp_output / "_redirects").exists()
-        assert (temp_output / "_headers").exists()
+        assert (output / "_redirects").exists()
+        assert (output / "_headers").exists()
 
-        redirects = (temp_output / "_redirects").read_text()
+        redirects = (output / "_redirects").read_text()
         assert "/index.html" in redirects
 
-    def test_builder_custom_repo_name(self, temp_source, temp_output, mock_frontend_dist):
+    def test_builder_custom_repo_name(self, build_site):
         """Test that custom repo name is used."""
-        builder = StaticSiteBuilder(
-            temp_source, temp_output, mock_frontend_dist, repo_name="my-docs"
-        )
-        builder.build()
+        output = build_site("my-docs")
 
-        info = json.loads((temp_output / "api" / "info.json").read_text())
+        info = json.loads((output / "api" / "info.json").read_text())
         assert info["name"] == "my-docs"
 
-        static = json.loads((temp_output / "api" / "static.json").read_text())
+        static = json.loads((output / "api" / "static.json").read_text())
         assert static["repo_name"] == "my-docs"
+
+    def test_builder_tar_mode(self, shared_source, shared_frontend_dist, build_site, tmp_path):
+        """Test that build_tar archives exactly what build() writes."""
+        archive = tmp_path / "site.tar"
+        StaticSiteBuilder(shared_source, tmp_path / "site", shared_frontend_dist).build_tar(archive)
+        output = build_site()
+
+        with tarfile.open(archive) as tar:
+            members = {m.name: m for m in tar.getmembers()}
+            expected = {p.relative_to(output).as_posix(): p for p in output.rglob("*")}
+            assert members.keys() == expected.keys()
+            for name, path in expected.items():
+                assert members[name].isdir() == path.is_dir()
+
+            static = json.loads(tar.extractfile("api/static.json").read())
+            assert static["static"] is True
+            index = tar.extractfile("index.html").read().decode()
+            assert index == (output / "index.html").read_text()
+        assert not (tmp_path / "site").exists()
@@ -0,0 +1,65 @@
+"""Tests for the file watcher's batched broadcasts."""
+
+import asyncio
+
+import orjson
+import pytest
+
+from vantage.services import watcher
+
+
+@pytest.fixture
+def broadcasts(monkeypatch):
+    """Record ``(loop_time, message)`` for every broadcast, with a clean limiter."""
+    sent: list[tuple[float, dict[str, object]]] = []
+
+    async def _record(data: bytes) -> None:
+        sent.append((asyncio.get_running_loop().time(), orjson.loads(data)))
+
+    monkeypatch.setattr(watcher.manager, "broadcast_bytes", _record)
+    monkeypatch.setattr(watcher, "_last_flush", {})
+    return sent
+
+
+@pytest.mark.asyncio
+async def test_overlapping_flushes_stay_spaced_and_ordered(broadcasts):
+    """Concurrent flushes for one repo go out in order, one interval apart."""
+    await watcher._coalesce_and_broadcast({"a.md"}, "repo")
+    await asyncio.gather(
+        watcher._coalesce_and_broadcast({"b.md"}, "repo"),
+        watcher._coalesce_and_broadcast({"c.md"}, "repo"),
+    )
+
+    assert [msg["paths"] for _, msg in broadcasts] == [["a.md"], ["b.md"], ["c.md"]]
+    times = [t for t, _ in broadcasts]
+    gaps = [later - earlier for earlier, later in zip(times, times[1:], strict=False)]
+    assert all(gap >= watcher._MIN_FLUSH_INTERVAL * 0.95 for gap in gaps), gaps
+
+
+@pytest.mark.asyncio
+async def test_flush_limit_is_per_repo(broadcasts):
+    """Another repo's recent flush does not delay this one."""
+    await watcher._coalesce_and_broadcast({"a.md"}, "alpha")
+    await watcher._coalesce_and_broadcast({"b.md"}, "beta")
+
+    (t_alpha, _), (t_beta, _) = broadcasts
+    assert t_beta - t_alpha < watcher._MIN_FLUSH_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_cancelled_quiet_task_keeps_its_slot(broadcasts):
+    """A shielded flush orphaned by a cancelled quiet task still delays the next one."""
+    await watcher._coalesce_and_broadcast({"a.md"}, "repo")
+    first = asyncio.ensure_future(watcher._coalesce_and_broadcast({"b.md"}, "repo"))
+
+    async def _quiet_task() -> None:
+        await asyncio.shield(first)
+
+    quiet = asyncio.create_task(_quiet_task())
+    await asyncio.sleep(0)
+    quiet.cancel()
+    await watcher._coalesce_and_broadcast({"c.md"}, "repo")
+    await first
+
+    assert [msg["paths"] for _, msg in broadcasts] == [["a.md"], ["b.md"], ["c.md"]]
+    assert broadcasts[2][0] - broadcasts[1][0] >= watcher._MIN_FLUSH_INTERVAL * 0.95